@@ -1,7 +1,7 @@
 """
 Authentication API endpoints for user registration and login.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import datetime
@@ -232,6 +232,7 @@ async def get_me(
 async def send_verification_code(
     data: SendVerificationCode,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -281,16 +282,14 @@ async def send_verification_code(
         await db.commit()
         await db.refresh(verification)
 
-        # Send email
-        email_sent = await email_service.send_verification_code(email_lower, verification.code)
-
-        if not email_sent:
-            # In development mode without SendGrid, still return success
-            if email_service.is_configured():
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to send verification email. Please try again."
-                )
+        # Send email after the response goes out, batched with concurrent requests
+        if email_service.is_configured():
+            background_tasks.add_task(
+                email_service.enqueue_verification_code, email_lower, verification.code
+            )
+        else:
+            # In development mode without SendGrid, log the code inline
+            await email_service.send_verification_code(email_lower, verification.code)
 
         # Calculate expiration time
         expires_in = int((verification.expires_at - datetime.utcnow()).total_seconds())
@@ -389,6 +388,7 @@ async def verify_email_code(
 async def resend_verification_code(
     data: SendVerificationCode,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -412,7 +412,7 @@ async def resend_verification_code(
         )
 
     # Reuse the send verification logic
-    return await send_verification_code(data, request, db)
+    return await send_verification_code(data, request, background_tasks=background_tasks, db=db)
 
 
 @router.post("/change-password", response_model=ChangePasswordResponse)
@@ -66,7 +66,8 @@ async def generate_summary(
                     existing,
                     transcription.text,
                     db,
-                    custom_prompt=request.custom_prompt
+                    custom_prompt=request.custom_prompt,
+                    language=transcription.language
                 )
                 await db.refresh(updated_summary)
                 return updated_summary
@@ -88,7 +89,8 @@ async def generate_summary(
             transcription.id,
             db,
             format=request.format,
-            custom_prompt=request.custom_prompt
+            custom_prompt=request.custom_prompt,
+            language=transcription.language
         )
 
         await db.refresh(summary)
@@ -229,7 +231,8 @@ async def regenerate_summary_from_audio(
             transcription.id,
             db,
             format=request.format or SummaryFormat.QUICK_SUMMARY,
-            custom_prompt=request.custom_prompt
+            custom_prompt=request.custom_prompt,
+            language=transcription.language
         )
 
         await db.refresh(new_summary)
@@ -289,7 +292,8 @@ async def update_existing_summary(
             transcription.text,
             db,
             format=request.format,
-            custom_prompt=request.custom_prompt
+            custom_prompt=request.custom_prompt,
+            language=transcription.language
         )
 
         await db.refresh(updated_summary)
@@ -332,7 +336,8 @@ async def rename_summary(
 
     # Update custom name
     summary.custom_name = request.custom_name
-    await db.commit()
+    # Flush only; get_db commits the request's transaction
+    await db.flush()
     await db.refresh(summary)
 
     return summary
@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     # Email Service Configuration
     EMAIL_SERVICE: str = "sendgrid"  # 'sendgrid' or 'ses'
     SENDGRID_API_KEY: str = ""
+    SENDGRID_MAX_REQUESTS_PER_SECOND: float = 10.0  # Client-side cap on mail/send calls
     # AWS SES Configuration (if using ses)
     AWS_SES_REGION: str = "us-east-1"
     AWS_SES_ACCESS_KEY_ID: str = ""
@@ -48,6 +49,10 @@ class Settings(BaseSettings):
 
     # Audio Processing
     ALLOWED_AUDIO_FORMATS: str = "mp3,wav,m4a,ogg,flac,webm"
+    WHISPER_SPECULATIVE_RETRIES: bool = False  # Send the first two temperatures concurrently (lower latency, more API cost)
+
+    # Summaries
+    SUMMARY_BATCHING_ENABLED: bool = False  # Combine concurrent short summaries (possibly from different users) into one Claude call
 
     # Redis Configuration (for rate limiting and caching)
     REDIS_URL: str = ""  # Optional: If not set, in-memory rate limiting is used
@@ -4,15 +4,30 @@ Uses SQLAlchemy async with PostgreSQL.
 """
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+import orjson
 from app.core.config import settings
 
 
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson (non-str keys allowed, like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
     pool_pre_ping=True,
+    # LIFO checkout keeps reusing the most recently returned (warm)
+    # connections, so idle overflow connections age out instead of all
+    # connections being rotated through
+    pool_use_lifo=True,
+    pool_size=10,
+    max_overflow=20,
+    pool_recycle=1800,  # Seconds; stay under server/PgBouncer idle timeouts
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -5,18 +5,53 @@ Voice recording app with AI transcription and summaries.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+import logging
 import os
+import queue
+from typing import Tuple
 
 from app.core.config import settings
 from app.db.database import init_db, close_db
 from app.api import recordings, transcriptions, summaries, admin, auth, payments, trials, users, analytics
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.email_service import email_service
+from app.services.audio_enhancer import shutdown_enhance_pool
+
+
+def start_log_listener() -> Tuple[QueueHandler, QueueListener]:
+    """
+    Route app.* log records through a queue.
+
+    Request handlers only enqueue records; formatting and the write to
+    stderr (often a pipe under Docker) happen on the listener's thread.
+
+    Returns:
+        The installed queue handler and started listener, to be passed to
+        stop_log_listener
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    logging.getLogger("app").addHandler(queue_handler)
+    listener.start()
+    return queue_handler, listener
+
+
+def stop_log_listener(queue_handler: QueueHandler, listener: QueueListener) -> None:
+    """Detach the queue handler and flush any records still queued."""
+    logging.getLogger("app").removeHandler(queue_handler)
+    listener.stop()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events for startup and shutdown."""
     # Startup
+    log_handler, log_listener = start_log_listener()
     print("🚀 Starting Take My Dictation API...")
 
     # Create upload directory if it doesn't exist
@@ -37,8 +72,13 @@ async def lifespan(app: FastAPI):
     print("👋 Shutting down...")
     await stop_scheduler()
     print("✅ Background scheduler stopped")
+    await email_service.flush_pending_verifications()
+    print("✅ Pending verification emails sent")
+    shutdown_enhance_pool()
+    print("✅ Audio enhancement workers stopped")
     await close_db()
     print("✅ Database connections closed")
+    stop_log_listener(log_handler, log_listener)
 
 
 # Create FastAPI app
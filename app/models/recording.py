@@ -2,7 +2,7 @@
 Recording database model.
 Stores metadata about uploaded audio recordings.
 """
-from sqlalchemy import Column, String, BigInteger, Float, DateTime, Enum, ForeignKey, Boolean
+from sqlalchemy import Column, String, BigInteger, Float, DateTime, Enum, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -47,5 +47,16 @@ class Recording(Base):
     transcription = relationship("Transcription", back_populates="recording", uselist=False, cascade="all, delete-orphan")
     summary = relationship("Summary", back_populates="recording", uselist=False, cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Partial covering index for the audio cleanup job's keyset scan
+        Index(
+            "ix_recordings_expiry",
+            audio_delete_at,
+            id,
+            postgresql_include=["file_path", "file_size"],
+            postgresql_where=(can_regenerate == True),
+        ),
+    )
+
     def __repr__(self):
         return f"<Recording {self.filename}>"
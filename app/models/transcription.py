@@ -20,6 +20,7 @@ class Transcription(Base):
     language = Column(String, nullable=True)
     confidence = Column(Float, nullable=True)
     provider = Column(String, nullable=False)  # whisper, assemblyai, etc.
+    audio_sha256 = Column(String(64), nullable=True, index=True)  # Source audio content hash, for dedup
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
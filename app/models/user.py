@@ -2,7 +2,7 @@
 User database model.
 Stores user account information and subscription details.
 """
-from sqlalchemy import Column, String, Boolean, DateTime, Enum, Float, Date
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, Float, Date, Index, extract
 from sqlalchemy.orm import relationship
 from datetime import datetime, date
 import uuid
@@ -55,5 +55,14 @@ class User(Base):
     # Relationships
     recordings = relationship("Recording", back_populates="user", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Daily monthly-reset lookup by anniversary day (paid users only)
+        Index(
+            "ix_users_reset_day",
+            extract("day", subscription_anniversary_date),
+            postgresql_where=(is_trial_user == False)
+        ),
+    )
+
     def __repr__(self):
         return f"<User {self.email}>"
@@ -2,12 +2,43 @@
 Audio enhancement service for optimal Whisper transcription.
 Includes noise reduction, normalization, and dynamic range compression.
 """
-from pydub import AudioSegment
-from pydub.effects import normalize, compress_dynamic_range
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import audioop
+import math
+import logging
+import multiprocessing
 import subprocess
 import os
-import tempfile
-from typing import Dict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Enhancement is CPU-bound, so it runs in worker processes rather than threads
+# to keep concurrent uploads from contending on the GIL. The pool is created on
+# first use with the spawn start method, so workers don't fork a copy of the
+# running event loop, DB pool or threads.
+_enhance_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_enhance_pool() -> ProcessPoolExecutor:
+    """Return the enhancement worker pool, creating it on first use."""
+    global _enhance_pool
+    if _enhance_pool is None:
+        _enhance_pool = ProcessPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 1) - 1),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _enhance_pool
+
+
+def shutdown_enhance_pool() -> None:
+    """Stop the enhancement worker processes, if any were started."""
+    global _enhance_pool
+    if _enhance_pool is not None:
+        _enhance_pool.shutdown(wait=True, cancel_futures=True)
+        _enhance_pool = None
 
 
 class AudioEnhancer:
@@ -16,6 +47,18 @@ class AudioEnhancer:
     Applies noise reduction, normalization, and compression.
     """
 
+    # Dynamic range compression (-20dBFS threshold, 4:1, 5ms attack, 50ms release).
+    # Runs as ffmpeg's native acompressor filter inside the encoder process.
+    COMPRESSOR_FILTER = "acompressor=threshold=-20dB:ratio=4:attack=5:release=50:knee=1"
+
+    # Intermediate PCM layout passed between the decode and encode stages
+    SAMPLE_RATE = 16000  # Whisper's native sample rate
+    SAMPLE_WIDTH = 2     # 16-bit
+    MAX_AMPLITUDE = 32768
+
+    # Peak normalization target, matching pydub.effects.normalize
+    NORMALIZE_HEADROOM_DB = 0.1
+
     @staticmethod
     def enhance_for_whisper(input_file: str, output_file: str) -> Dict:
         """
@@ -32,14 +75,7 @@ class AudioEnhancer:
         Returns:
             Dictionary with enhancement metadata
         """
-        temp_denoised = None
-
         try:
-            # Create temp file for intermediate step
-            temp_denoised = tempfile.NamedTemporaryFile(
-                suffix='.wav', delete=False
-            ).name
-
             # STEP 1: Noise reduction with ffmpeg
             # - highpass=f=80: Remove rumble below 80Hz
             # - lowpass=f=8000: Remove hiss above 8kHz
@@ -48,50 +84,63 @@ class AudioEnhancer:
                 'ffmpeg',
                 '-i', input_file,
                 '-af', 'highpass=f=80,lowpass=f=8000,afftdn=nf=-20',
-                '-ar', '16000',  # Whisper's native sample rate
+                '-ar', str(AudioEnhancer.SAMPLE_RATE),
                 '-ac', '1',      # Mono
-                temp_denoised,
-                '-y',            # Overwrite
+                '-f', 's16le',   # Raw 16-bit PCM, no container to re-parse
+                'pipe:1',
                 '-loglevel', 'error'
             ]
 
-            print(f"🔊 Applying noise reduction and filters...")
-            subprocess.run(
+            logger.debug("🔊 Applying noise reduction and filters...")
+            denoised = subprocess.run(
                 denoise_command,
                 check=True,
                 capture_output=True
             )
 
-            # STEP 2: Load and normalize
-            print(f"📊 Normalizing audio volume...")
-            audio = AudioSegment.from_file(temp_denoised)
-            original_dbfs = audio.dBFS
-            audio = normalize(audio)
+            # STEP 2: Normalize
+            # Work directly on the piped PCM buffer - no AudioSegment wrapper and
+            # no intermediate WAV file between the decode and encode stages
+            logger.debug("📊 Normalizing audio volume...")
+            pcm = denoised.stdout
+            rms = audioop.rms(pcm, AudioEnhancer.SAMPLE_WIDTH)
+            original_dbfs = 20 * math.log10(rms / AudioEnhancer.MAX_AMPLITUDE) if rms else -float('inf')
+
+            peak = audioop.max(pcm, AudioEnhancer.SAMPLE_WIDTH)
+            if peak:
+                target_peak = AudioEnhancer.MAX_AMPLITUDE * 10 ** (-AudioEnhancer.NORMALIZE_HEADROOM_DB / 20)
+                pcm = audioop.mul(pcm, AudioEnhancer.SAMPLE_WIDTH, target_peak / peak)
 
-            # STEP 3: Compress dynamic range
+            # STEP 3 + 4: Compress dynamic range while encoding to optimal format
             # Makes quiet parts louder, loud parts quieter
-            print(f"⚙️  Compressing dynamic range...")
-            audio = compress_dynamic_range(
-                audio,
-                threshold=-20.0,
-                ratio=4.0,
-                attack=5.0,
-                release=50.0
+            logger.debug("💾 Compressing dynamic range and exporting enhanced audio...")
+            encode_command = [
+                'ffmpeg',
+                '-y',            # Overwrite
+                '-loglevel', 'error',
+                '-f', 's16le',
+                '-ar', str(AudioEnhancer.SAMPLE_RATE),
+                '-ac', '1',
+                '-i', 'pipe:0',
+                '-af', AudioEnhancer.COMPRESSOR_FILTER,
+                '-f', 'mp3',
+                '-b:a', '128k',
+                '-q:a', '0',
+                output_file
+            ]
+            subprocess.run(
+                encode_command,
+                input=memoryview(pcm),
+                check=True,
+                capture_output=True
             )
 
-            # STEP 4: Export in optimal format
-            print(f"💾 Exporting enhanced audio...")
-            audio.export(
-                output_file,
-                format="mp3",
-                bitrate="128k",
-                parameters=["-q:a", "0"]
+            logger.info(
+                "✅ Audio enhancement complete (original volume: %.2fdB, output: %s)",
+                original_dbfs,
+                output_file
             )
 
-            print(f"✅ Audio enhancement complete!")
-            print(f"   - Original volume: {original_dbfs:.2f}dB")
-            print(f"   - Output: {output_file}")
-
             return {
                 'success': True,
                 'original_dbfs': original_dbfs,
@@ -100,30 +149,26 @@ class AudioEnhancer:
 
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.decode() if e.stderr else str(e)
-            print(f"❌ FFmpeg error: {error_msg}")
+            logger.error("❌ FFmpeg error: %s", error_msg)
             return {
                 'success': False,
                 'error': f"ffmpeg error: {error_msg}"
             }
         except Exception as e:
-            print(f"❌ Enhancement error: {str(e)}")
+            logger.error("❌ Enhancement error: %s", e)
             return {
                 'success': False,
                 'error': str(e)
             }
-        finally:
-            # Cleanup temp file
-            if temp_denoised and os.path.exists(temp_denoised):
-                try:
-                    os.remove(temp_denoised)
-                except Exception:
-                    pass
 
     @staticmethod
     async def enhance_for_whisper_async(input_file: str, output_file: str) -> Dict:
         """
         Async wrapper for enhance_for_whisper.
 
+        Runs the pipeline in the shared process pool so the event loop stays
+        free and concurrent enhancements use separate cores.
+
         Args:
             input_file: Path to input audio file
             output_file: Path for enhanced output file
@@ -131,6 +176,10 @@ class AudioEnhancer:
         Returns:
             Dictionary with enhancement metadata
         """
-        # Audio processing is CPU-bound, so we run it synchronously
-        # For true async, you'd use asyncio.to_thread() in Python 3.9+
-        return AudioEnhancer.enhance_for_whisper(input_file, output_file)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_enhance_pool(),
+            AudioEnhancer.enhance_for_whisper,
+            input_file,
+            output_file
+        )
@@ -4,8 +4,12 @@ Works with any audio format, quality, or language.
 """
 from pydub import AudioSegment
 from pydub.effects import normalize
+from functools import lru_cache
+import audioop
+import av
+import math
 import os
-from typing import Dict
+from typing import Dict, Iterator
 
 
 class AudioProcessor:
@@ -25,32 +29,148 @@ class AudioProcessor:
         """
         Analyze audio to determine preprocessing needs.
 
+        Stream parameters come from the container header; loudness is
+        accumulated block by block while decoding, so the clip is never held
+        in memory as a whole. Results are memoized on (path, mtime, size), so
+        e.g. /stats followed by /transcribe decodes an upload only once.
+
         Args:
             file_path: Path to audio file
 
         Returns:
             Dictionary with audio metadata
         """
-        audio = AudioSegment.from_file(file_path)
+        st = os.stat(file_path)
+        return dict(AudioProcessor._analyze_cached(file_path, st.st_mtime_ns, st.st_size))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _analyze_cached(file_path: str, mtime_ns: int, size: int) -> Dict:
+        """
+        Decode and measure a file; mtime_ns and size only key the cache.
+
+        Callers get a copy from analyze_audio, so the cached dict is never mutated.
+        """
+        sum_squares = 0
+        sample_count = 0
+
+        with av.open(file_path) as container:
+            stream = container.streams.audio[0]
+            sample_rate = stream.codec_context.sample_rate
+            channels = stream.codec_context.channels
+
+        for block in AudioProcessor._decode_pcm(file_path, av.AudioResampler(format='s16')):
+            block_samples = len(block) // 2
+            sum_squares += audioop.rms(block, 2) ** 2 * block_samples
+            sample_count += block_samples
+
+        frame_count = float(sample_count // channels) if channels else 0.0
+        rms = int(math.sqrt(sum_squares / sample_count)) if sample_count else 0
+        duration_seconds = frame_count / sample_rate if sample_rate else 0.0
 
         return {
-            'duration_ms': len(audio),
-            'duration_seconds': len(audio) / 1000.0,
-            'sample_rate': audio.frame_rate,
-            'channels': audio.channels,
-            'sample_width': audio.sample_width,
-            'frame_count': audio.frame_count(),
-            'rms': audio.rms,  # Root mean square (volume indicator)
-            'dBFS': audio.dBFS,  # Decibels relative to full scale
+            'duration_ms': round(duration_seconds * 1000),
+            'duration_seconds': duration_seconds,
+            'sample_rate': sample_rate,
+            'channels': channels,
+            'sample_width': 2,
+            'frame_count': frame_count,
+            'rms': rms,  # Root mean square (volume indicator)
+            'dBFS': 20 * math.log10(rms / 32768) if rms else -float('inf'),  # Decibels relative to full scale
         }
 
+    @staticmethod
+    def probe_audio(file_path: str) -> Dict:
+        """
+        Read duration and stream parameters from the container header.
+
+        Unlike analyze_audio this doesn't decode the audio, so it carries no
+        loudness figures. Containers without a duration in their header
+        (e.g. streamed WebM) fall back to a full analyze_audio pass.
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            Dictionary with duration_seconds, sample_rate and channels
+        """
+        with av.open(file_path) as container:
+            stream = container.streams.audio[0]
+            sample_rate = stream.codec_context.sample_rate
+            channels = stream.codec_context.channels
+
+            if stream.duration is not None and stream.time_base is not None:
+                duration_seconds = float(stream.duration * stream.time_base)
+            elif container.duration is not None:
+                duration_seconds = container.duration / av.time_base
+            else:
+                duration_seconds = None
+
+        if duration_seconds is None:
+            return AudioProcessor.analyze_audio(file_path)
+
+        return {
+            'duration_ms': round(duration_seconds * 1000),
+            'duration_seconds': duration_seconds,
+            'sample_rate': sample_rate,
+            'channels': channels,
+        }
+
+    @staticmethod
+    def _decode_pcm(file_path: str, resampler: av.AudioResampler) -> Iterator[bytes]:
+        """
+        Decode the first audio stream into packed 16-bit PCM blocks.
+
+        Args:
+            file_path: Path to audio file
+            resampler: Resampler converting decoded frames to packed s16
+
+        Yields:
+            Raw PCM bytes, one block per resampled frame
+        """
+        with av.open(file_path) as container:
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    yield bytes(resampled.planes[0])[:resampled.samples * resampled.layout.nb_channels * 2]
+
+        # Flush samples still buffered in the resampler
+        for resampled in resampler.resample(None):
+            yield bytes(resampled.planes[0])[:resampled.samples * resampled.layout.nb_channels * 2]
+
+    @staticmethod
+    def _load_resampled(file_path: str) -> AudioSegment:
+        """
+        Decode audio directly to Whisper's native mono 16kHz PCM.
+
+        Downmixing and resampling run in libswresample's polyphase filter as
+        each frame is decoded, rather than in pydub afterwards on the full clip.
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            Mono 16kHz 16-bit AudioSegment
+        """
+        resampler = av.AudioResampler(
+            format='s16',
+            layout='mono',
+            rate=AudioProcessor.OPTIMAL_SAMPLE_RATE
+        )
+
+        return AudioSegment(
+            data=b''.join(AudioProcessor._decode_pcm(file_path, resampler)),
+            sample_width=2,
+            frame_rate=AudioProcessor.OPTIMAL_SAMPLE_RATE,
+            channels=AudioProcessor.OPTIMAL_CHANNELS
+        )
+
     @staticmethod
     def preprocess_audio(input_path: str, output_path: str) -> Dict:
         """
         Universal preprocessing pipeline.
 
         Steps:
-        1. Convert to WAV (uncompressed, for processing)
+        1. Decode to mono 16kHz PCM (resampled while decoding)
         2. Apply intelligent normalization
         3. Convert to optimal format for Whisper
 
@@ -62,8 +182,8 @@ class AudioProcessor:
             Processing metadata
         """
         try:
-            # Step 1: Load audio (handles ANY format)
-            audio = AudioSegment.from_file(input_path)
+            # Step 1: Load audio (handles ANY format) as mono at Whisper's native rate
+            audio = AudioProcessor._load_resampled(input_path)
 
             # Step 2: Analyze to decide preprocessing intensity
             original_dBFS = audio.dBFS
@@ -76,15 +196,7 @@ class AudioProcessor:
             else:
                 normalized = False
 
-            # Step 4: Convert to mono (Whisper works better with mono)
-            if audio.channels > 1:
-                audio = audio.set_channels(1)
-
-            # Step 5: Resample to Whisper's native rate
-            if audio.frame_rate != AudioProcessor.OPTIMAL_SAMPLE_RATE:
-                audio = audio.set_frame_rate(AudioProcessor.OPTIMAL_SAMPLE_RATE)
-
-            # Step 6: Export with optimal settings
+            # Step 4: Export with optimal settings
             audio.export(
                 output_path,
                 format=AudioProcessor.OPTIMAL_FORMAT,
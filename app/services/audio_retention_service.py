@@ -3,9 +3,10 @@ Audio retention service for managing audio file lifecycle.
 Handles retention policies, scheduled deletion, and cleanup.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, tuple_
 from datetime import datetime, timedelta
 from typing import Dict, Optional
+import asyncio
 import os
 import logging
 
@@ -18,6 +19,32 @@ logger = logging.getLogger(__name__)
 class AudioRetentionService:
     """Service for managing audio file retention and cleanup."""
 
+    # Pro users keep audio (and can regenerate summaries) for this many days
+    PRO_RETENTION_DAYS = 10
+    PRO_RETENTION_PERIOD = timedelta(days=PRO_RETENTION_DAYS)
+
+    # Maximum number of file unlinks in flight during cleanup
+    CLEANUP_UNLINK_CONCURRENCY = 64
+
+    # Expired recordings fetched and updated per cleanup round trip
+    CLEANUP_BATCH_SIZE = 500
+
+    @staticmethod
+    def _unlink_if_exists(file_path: Optional[str]) -> bool:
+        """
+        Delete a file from disk if it exists.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            True if deleted, False if the file doesn't exist
+        """
+        if file_path and os.path.exists(file_path):
+            os.remove(file_path)
+            return True
+        return False
+
     @staticmethod
     async def set_retention_policy(
         recording: Recording,
@@ -49,18 +76,17 @@ class AudioRetentionService:
 
         if user and user.subscription_tier == SubscriptionTier.PRO:
             # Pro users get 10-day retention
-            recording.audio_delete_at = now + timedelta(days=10)
+            recording.audio_delete_at = now + AudioRetentionService.PRO_RETENTION_PERIOD
             recording.can_regenerate = True
             recording.audio_retention_enabled = True
 
             await db.commit()
-            await db.refresh(recording)
 
             return {
                 "retention_enabled": True,
                 "tier": "pro",
                 "audio_delete_at": recording.audio_delete_at,
-                "days_remaining": 10,
+                "days_remaining": AudioRetentionService.PRO_RETENTION_DAYS,
                 "can_regenerate": True
             }
 
@@ -68,7 +94,6 @@ class AudioRetentionService:
             # Free/Basic users: immediate deletion
             tier = user.subscription_tier.value
             await db.commit()
-            await db.refresh(recording)
 
             return {
                 "retention_enabled": False,
@@ -82,7 +107,6 @@ class AudioRetentionService:
         else:
             # Anonymous upload
             await db.commit()
-            await db.refresh(recording)
 
             return {
                 "retention_enabled": False,
@@ -116,7 +140,10 @@ class AudioRetentionService:
             raise Exception(f"Recording {recording_id} not found")
 
         now = datetime.utcnow()
-        audio_exists = os.path.exists(recording.file_path) if recording.file_path else False
+        audio_exists = (
+            await asyncio.to_thread(os.path.exists, recording.file_path)
+            if recording.file_path else False
+        )
 
         # Calculate days remaining
         days_remaining = 0
@@ -174,18 +201,17 @@ class AudioRetentionService:
         # Enable retention
         now = datetime.utcnow()
         recording.audio_retention_enabled = True
-        recording.audio_delete_at = now + timedelta(days=10)
+        recording.audio_delete_at = now + AudioRetentionService.PRO_RETENTION_PERIOD
         recording.can_regenerate = True
 
         await db.commit()
-        await db.refresh(recording)
 
         return {
             "success": True,
             "recording_id": recording_id,
             "audio_retention_enabled": True,
             "audio_delete_at": recording.audio_delete_at,
-            "days_remaining": 10,
+            "days_remaining": AudioRetentionService.PRO_RETENTION_DAYS,
             "can_regenerate": True
         }
 
@@ -221,14 +247,14 @@ class AudioRetentionService:
         if not force and user and recording.user_id != user.id:
             raise Exception("You can only delete audio for your own recordings")
 
-        # Delete physical file
+        # Delete physical file (off the event loop, like the batch cleanup)
         file_deleted = False
-        if recording.file_path and os.path.exists(recording.file_path):
-            try:
-                os.remove(recording.file_path)
-                file_deleted = True
-            except Exception as e:
-                print(f"⚠️  Failed to delete audio file {recording.file_path}: {e}")
+        try:
+            file_deleted = await asyncio.to_thread(
+                AudioRetentionService._unlink_if_exists, recording.file_path
+            )
+        except Exception as e:
+            logger.warning("⚠️  Failed to delete audio file %s: %s", recording.file_path, e)
 
         # Update database
         recording.can_regenerate = False
@@ -236,7 +262,6 @@ class AudioRetentionService:
         recording.audio_delete_at = datetime.utcnow()  # Mark as deleted
 
         await db.commit()
-        await db.refresh(recording)
 
         return {
             "success": True,
@@ -262,70 +287,113 @@ class AudioRetentionService:
         """
         now = datetime.utcnow()
 
-        # Find recordings with expired audio that haven't been cleaned up yet
-        result = await db.execute(
-            select(Recording).filter(
-                Recording.audio_delete_at <= now,
-                Recording.can_regenerate == True  # Still has audio file
-            )
-        )
-        expired_recordings = result.scalars().all()
-
-        logger.info(f"📊 Found {len(expired_recordings)} expired audio files to clean up")
-
         deleted_count = 0
         failed_count = 0
         total_size_freed = 0
+        expired_total = 0
+
+        # Unlink files concurrently on worker threads, bounded by a semaphore
+        semaphore = asyncio.Semaphore(AudioRetentionService.CLEANUP_UNLINK_CONCURRENCY)
+
+        async def unlink(file_path: Optional[str]) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(AudioRetentionService._unlink_if_exists, file_path)
+
+        # Walk expired recordings in keyset-ordered batches so memory stays bounded
+        # and each batch is an index range scan on ix_recordings_expiry.
+        # Only the columns needed are selected, so no ORM instances are built.
+        last_key = None
+
+        while True:
+            query = (
+                select(
+                    Recording.id,
+                    Recording.file_path,
+                    Recording.file_size,
+                    Recording.audio_delete_at
+                )
+                .filter(
+                    Recording.audio_delete_at <= now,
+                    Recording.can_regenerate == True  # Still has audio file
+                )
+                .order_by(Recording.audio_delete_at, Recording.id)
+                .limit(AudioRetentionService.CLEANUP_BATCH_SIZE)
+            )
+            if last_key is not None:
+                query = query.filter(tuple_(Recording.audio_delete_at, Recording.id) > last_key)
+
+            result = await db.execute(query)
+            expired_recordings = result.all()
+
+            if not expired_recordings:
+                break
+
+            expired_total += len(expired_recordings)
+            last_key = (expired_recordings[-1].audio_delete_at, expired_recordings[-1].id)
+            cleaned_ids = []
 
-        for recording in expired_recordings:
-            try:
-                file_size = recording.file_size if recording.file_size else 0
-                file_path = recording.file_path
+            outcomes = await asyncio.gather(
+                *(unlink(file_path) for _, file_path, _, _ in expired_recordings),
+                return_exceptions=True
+            )
+
+            for (recording_id, file_path, file_size, audio_delete_at), outcome in zip(expired_recordings, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error("❌ Failed to delete audio for recording %s...: %s", recording_id[:8], outcome)
+                    failed_count += 1
+                    continue
 
-                # Delete physical file
-                if file_path and os.path.exists(file_path):
-                    os.remove(file_path)
+                file_size = file_size if file_size else 0
+
+                if outcome:
                     total_size_freed += file_size
                     deleted_count += 1
 
-                    # Calculate how long ago the file was supposed to be deleted
-                    overdue_delta = now - recording.audio_delete_at
-                    overdue_days = overdue_delta.days
-                    overdue_info = f" (overdue by {overdue_days} days)" if overdue_days > 0 else ""
-
-                    logger.info(
-                        f"🗑️  Deleted expired audio: {recording.id[:8]}... "
-                        f"({round(file_size / (1024 * 1024), 2)} MB){overdue_info}"
-                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        # Calculate how long ago the file was supposed to be deleted
+                        overdue_days = (now - audio_delete_at).days
+                        overdue_info = f" (overdue by {overdue_days} days)" if overdue_days > 0 else ""
+
+                        logger.info(
+                            "🗑️  Deleted expired audio: %s... (%s MB)%s",
+                            recording_id[:8],
+                            round(file_size / (1024 * 1024), 2),
+                            overdue_info
+                        )
                 else:
                     # File already deleted or doesn't exist
                     logger.warning(
-                        f"⚠️  Audio file not found for recording {recording.id[:8]}..., "
-                        f"updating database only"
+                        "⚠️  Audio file not found for recording %s..., updating database only",
+                        recording_id[:8]
                     )
 
-                # Update database - keep transcription and summary, just mark audio as deleted
-                recording.can_regenerate = False
-                recording.audio_retention_enabled = False
+                cleaned_ids.append(recording_id)
 
-            except Exception as e:
-                logger.error(f"❌ Failed to delete audio for recording {recording.id[:8]}...: {e}")
-                failed_count += 1
-                continue
+            # Update database in one statement per batch - keep transcription and summary,
+            # just mark audio as deleted
+            if cleaned_ids:
+                await db.execute(
+                    update(Recording)
+                    .where(Recording.id.in_(cleaned_ids))
+                    .values(can_regenerate=False, audio_retention_enabled=False)
+                )
+                await db.commit()
+                logger.info("💾 Committed %d database updates", len(cleaned_ids))
 
-        # Commit all changes
-        if deleted_count > 0 or failed_count > 0:
-            await db.commit()
-            logger.info(f"💾 Committed {deleted_count + failed_count} database updates")
+            if len(expired_recordings) < AudioRetentionService.CLEANUP_BATCH_SIZE:
+                break
+
+        logger.info("📊 Processed %d expired audio files", expired_total)
 
         # Log final summary
         if deleted_count > 0:
             logger.info(
-                f"✅ Audio cleanup successful: {deleted_count} files deleted, "
-                f"{round(total_size_freed / (1024 * 1024), 2)} MB freed"
+                "✅ Audio cleanup successful: %d files deleted, %s MB freed",
+                deleted_count,
+                round(total_size_freed / (1024 * 1024), 2)
             )
         if failed_count > 0:
-            logger.warning(f"⚠️  {failed_count} files failed to delete")
+            logger.warning("⚠️  %d files failed to delete", failed_count)
 
         return {
             "success": True,
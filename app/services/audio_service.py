@@ -3,18 +3,33 @@ Audio processing service.
 Handles audio file operations and metadata extraction.
 """
 from fastapi import UploadFile
+from concurrent.futures import ThreadPoolExecutor
 import aiofiles
+import asyncio
 import os
+import av
 import ffmpeg
+import logging
 from typing import Optional, Dict
 
+logger = logging.getLogger(__name__)
+
+# Probing blocks on file I/O (and on a subprocess in the ffprobe fallback),
+# so it runs on a shared pool to keep the event loop free and let concurrent
+# probes overlap.
+_PROBE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="audio-probe")
+
 
 class AudioService:
     """Service for audio file operations."""
 
-    async def get_audio_metadata(self, file_path: str) -> Dict:
+    @staticmethod
+    def _probe(file_path: str) -> Dict:
         """
-        Get comprehensive audio metadata using ffmpeg.
+        Read audio stream headers in-process with PyAV.
+
+        Only the container header is parsed, so no ffprobe process is spawned.
+        Falls back to ffprobe for containers PyAV cannot open.
 
         Args:
             file_path: Path to audio file
@@ -23,30 +38,90 @@ class AudioService:
             Dictionary with audio metadata
 
         Raises:
-            Exception: If ffmpeg probe fails
+            Exception: If the file has no audio stream or cannot be probed
         """
         try:
-            probe = ffmpeg.probe(file_path)
-            audio_stream = next(
-                (stream for stream in probe['streams'] if stream['codec_type'] == 'audio'),
-                None
-            )
+            with av.open(file_path) as container:
+                stream = next(
+                    (stream for stream in container.streams if stream.type == 'audio'),
+                    None
+                )
+
+                if not stream:
+                    raise Exception("No audio stream found in file")
+
+                if container.duration is not None:
+                    duration = float(container.duration) / av.time_base
+                elif stream.duration is not None and stream.time_base is not None:
+                    duration = float(stream.duration * stream.time_base)
+                else:
+                    duration = 0.0
+
+                return {
+                    'duration': duration,
+                    'format': container.format.name or 'unknown',
+                    'bit_rate': int(container.bit_rate or 0),
+                    'sample_rate': int(stream.codec_context.sample_rate or 0),
+                    'channels': int(stream.codec_context.channels or 0),
+                    'codec': stream.codec_context.name or 'unknown',
+                    'file_size': os.path.getsize(file_path)
+                }
+
+        except av.FFmpegError:
+            return AudioService._ffprobe(file_path)
+
+    @staticmethod
+    def _ffprobe(file_path: str) -> Dict:
+        """
+        Read audio metadata by running ffprobe (fallback for exotic formats).
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            Dictionary with audio metadata
+
+        Raises:
+            Exception: If the file has no audio stream
+        """
+        probe = ffmpeg.probe(file_path)
+        audio_stream = next(
+            (stream for stream in probe['streams'] if stream['codec_type'] == 'audio'),
+            None
+        )
+
+        if not audio_stream:
+            raise Exception("No audio stream found in file")
+
+        return {
+            'duration': float(probe['format'].get('duration', 0)),
+            'format': probe['format'].get('format_name', 'unknown'),
+            'bit_rate': int(probe['format'].get('bit_rate', 0)),
+            'sample_rate': int(audio_stream.get('sample_rate', 0)),
+            'channels': int(audio_stream.get('channels', 0)),
+            'codec': audio_stream.get('codec_name', 'unknown'),
+            'file_size': int(probe['format'].get('size', 0))
+        }
+
+    async def get_audio_metadata(self, file_path: str) -> Dict:
+        """
+        Get comprehensive audio metadata from the container headers.
+
+        Args:
+            file_path: Path to audio file
 
-            if not audio_stream:
-                raise Exception("No audio stream found in file")
+        Returns:
+            Dictionary with audio metadata
 
-            return {
-                'duration': float(probe['format'].get('duration', 0)),
-                'format': probe['format'].get('format_name', 'unknown'),
-                'bit_rate': int(probe['format'].get('bit_rate', 0)),
-                'sample_rate': int(audio_stream.get('sample_rate', 0)),
-                'channels': int(audio_stream.get('channels', 0)),
-                'codec': audio_stream.get('codec_name', 'unknown'),
-                'file_size': int(probe['format'].get('size', 0))
-            }
+        Raises:
+            Exception: If probing fails
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_PROBE_POOL, self._probe, file_path)
 
         except Exception as e:
-            print(f"Warning: Could not get audio metadata: {e}")
+            logger.warning("Could not get audio metadata: %s", e)
             raise Exception(f"Failed to extract audio metadata: {e}")
 
     async def save_uploaded_file(self, upload_file: UploadFile, destination: str) -> int:
@@ -75,23 +150,21 @@ class AudioService:
 
     async def get_audio_duration(self, file_path: str) -> Optional[float]:
         """
-        Get duration of audio file using ffmpeg.
+        Get duration of audio file from the container headers.
 
         Args:
             file_path: Path to audio file
 
         Returns:
             Duration in seconds, or None if unable to determine
-
-        Raises:
-            Exception: If ffmpeg probe fails
         """
         try:
-            probe = ffmpeg.probe(file_path)
-            duration = float(probe['format']['duration'])
-            return duration
+            loop = asyncio.get_running_loop()
+            metadata = await loop.run_in_executor(_PROBE_POOL, self._probe, file_path)
+            duration = metadata['duration']
+            return duration or None
         except Exception as e:
-            print(f"Warning: Could not get audio duration: {e}")
+            logger.warning("Could not get audio duration: %s", e)
             return None
 
     async def convert_audio_format(
@@ -124,8 +197,9 @@ class AudioService:
             )
             return True
         except ffmpeg.Error as e:
-            print(f"FFmpeg error: {e.stderr.decode()}")
-            raise Exception(f"Audio conversion failed: {e.stderr.decode()}")
+            error_msg = e.stderr.decode()
+            logger.error("FFmpeg error: %s", error_msg)
+            raise Exception(f"Audio conversion failed: {error_msg}")
 
     def delete_file(self, file_path: str) -> bool:
         """
@@ -2,14 +2,265 @@
 Email service for sending verification codes and notifications.
 Uses SendGrid for email delivery.
 """
-from typing import Optional
+from typing import List, Optional, Tuple
+import asyncio
 import logging
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Email, To, Content
+import time
+import requests
+from jinja2 import DictLoader, Environment, select_autoescape
+from requests.adapters import HTTPAdapter
+from sendgrid.helpers.mail import Mail, Email, To, Content, Personalization, Substitution
+from urllib3.util.retry import Retry
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+SENDGRID_TIMEOUT_SECONDS = 10
+
+# SendGrid accepts at most 1000 personalizations per request
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
+# Verification requests arriving within this window are sent as one batch
+VERIFICATION_BATCH_WINDOW_SECONDS = 0.2
+
+# Upper bound on SendGrid requests in flight from this process; extra sends
+# queue here rather than exhausting sockets or tripping provider throttling
+SENDGRID_MAX_CONCURRENT_SENDS = 20
+_SEND_SEM = asyncio.Semaphore(SENDGRID_MAX_CONCURRENT_SENDS)
+
+# Substitution tag replaced per recipient by SendGrid in bulk sends
+_CODE_TAG = "-code-"
+
+# Email bodies are compiled once at import; each send only renders the
+# per-recipient fields.
+_VERIFICATION_HTML_SOURCE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+        }
+        .container {
+            max-width: 600px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        .header {
+            background-color: #4F46E5;
+            color: white;
+            padding: 20px;
+            text-align: center;
+            border-radius: 8px 8px 0 0;
+        }
+        .content {
+            background-color: #f9fafb;
+            padding: 30px;
+            border-radius: 0 0 8px 8px;
+        }
+        .code {
+            font-size: 32px;
+            font-weight: bold;
+            color: #4F46E5;
+            letter-spacing: 8px;
+            text-align: center;
+            padding: 20px;
+            background-color: white;
+            border-radius: 8px;
+            margin: 20px 0;
+        }
+        .footer {
+            text-align: center;
+            color: #666;
+            font-size: 12px;
+            margin-top: 20px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Take My Dictation</h1>
+        </div>
+        <div class="content">
+            <h2>Email Verification</h2>
+            <p>Thank you for signing up! Please use the verification code below to complete your registration:</p>
+
+            <div class="code">{{ code }}</div>
+
+            <p>This code will expire in <strong>15 minutes</strong>.</p>
+
+            <p>If you didn't request this code, you can safely ignore this email.</p>
+
+            <div class="footer">
+                <p>&copy; 2026 Take My Dictation. All rights reserved.</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_VERIFICATION_TEXT_SOURCE = """
+Take My Dictation - Email Verification
+
+Thank you for signing up!
+
+Your verification code is: {{ code }}
+
+This code will expire in 15 minutes.
+
+If you didn't request this code, you can safely ignore this email.
+
+© 2026 Take My Dictation. All rights reserved.
+"""
+
+_WELCOME_HTML_SOURCE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+        }
+        .container {
+            max-width: 600px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        .header {
+            background-color: #4F46E5;
+            color: white;
+            padding: 20px;
+            text-align: center;
+            border-radius: 8px 8px 0 0;
+        }
+        .content {
+            background-color: #f9fafb;
+            padding: 30px;
+            border-radius: 0 0 8px 8px;
+        }
+        .button {
+            display: inline-block;
+            background-color: #4F46E5;
+            color: white;
+            padding: 12px 30px;
+            text-decoration: none;
+            border-radius: 6px;
+            margin: 20px 0;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Welcome to Take My Dictation!</h1>
+        </div>
+        <div class="content">
+            <p>{% if name %}Hi {{ name }}{% else %}Welcome{% endif %},</p>
+
+            <p>Your email has been verified successfully! You're all set to start using Take My Dictation.</p>
+
+            <p><strong>What's next?</strong></p>
+            <ul>
+                <li>Choose your subscription plan</li>
+                <li>Start recording and get AI-powered summaries</li>
+                <li>Export to Word or PDF</li>
+            </ul>
+
+            <p>If you have any questions, feel free to reach out to our support team.</p>
+
+            <p>Happy dictating!</p>
+
+            <p style="margin-top: 30px;">
+                <small>&copy; 2026 Take My Dictation. All rights reserved.</small>
+            </p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_WELCOME_TEXT_SOURCE = """
+Welcome to Take My Dictation!
+
+{% if name %}Hi {{ name }}{% else %}Welcome{% endif %},
+
+Your email has been verified successfully! You're all set to start using Take My Dictation.
+
+What's next?
+- Choose your subscription plan
+- Start recording and get AI-powered summaries
+- Export to Word or PDF
+
+If you have any questions, feel free to reach out to our support team.
+
+Happy dictating!
+
+© 2026 Take My Dictation. All rights reserved.
+"""
+
+# Templates are compiled once and kept for the life of the process; HTML
+# bodies autoescape recipient-supplied values
+_TEMPLATE_ENV = Environment(
+    loader=DictLoader({
+        'verification.html': _VERIFICATION_HTML_SOURCE,
+        'verification.txt': _VERIFICATION_TEXT_SOURCE,
+        'welcome.html': _WELCOME_HTML_SOURCE,
+        'welcome.txt': _WELCOME_TEXT_SOURCE,
+    }),
+    autoescape=select_autoescape(enabled_extensions=('html',), default=False),
+    keep_trailing_newline=True,
+    auto_reload=False,
+    cache_size=-1
+)
+_VERIFICATION_HTML_TEMPLATE = _TEMPLATE_ENV.get_template('verification.html')
+_VERIFICATION_TEXT_TEMPLATE = _TEMPLATE_ENV.get_template('verification.txt')
+_WELCOME_HTML_TEMPLATE = _TEMPLATE_ENV.get_template('welcome.html')
+_WELCOME_TEXT_TEMPLATE = _TEMPLATE_ENV.get_template('welcome.txt')
+
+_VERIFICATION_SUBJECT_PREFIX = "Your verification code is "
+_WELCOME_SUBJECT = "Welcome to Take My Dictation!"
+
+# Bulk verification bodies carry the SendGrid substitution tag in place of the code
+_BULK_VERIFICATION_HTML = _VERIFICATION_HTML_TEMPLATE.render(code=_CODE_TAG)
+_BULK_VERIFICATION_TEXT = _VERIFICATION_TEXT_TEMPLATE.render(code=_CODE_TAG)
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket limiter for outbound API calls.
+
+    Allows short bursts up to `burst` calls, then spaces calls at `rate`
+    per second. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed under the rate limit."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated_at = time.monotonic()
+
+            self._tokens -= 1
+
 
 class EmailService:
     """Email service for sending verification codes and notifications."""
@@ -19,14 +270,96 @@ class EmailService:
         self.client = None
         if settings.SENDGRID_API_KEY and len(settings.SENDGRID_API_KEY) > 10:
             try:
-                self.client = SendGridAPIClient(settings.SENDGRID_API_KEY)
+                self.client = self._build_session(settings.SENDGRID_API_KEY)
             except Exception as e:
                 logger.error(f"Failed to initialize SendGrid client: {e}")
 
+        # Sender never changes between sends
+        self.from_email = Email(settings.EMAIL_FROM_ADDRESS, settings.EMAIL_FROM_NAME)
+
+        # Verification codes waiting for the next batch flush
+        self._pending_verifications: List[Tuple[str, str, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Keeps bursts under SendGrid's rate limit instead of running into 429s
+        rate = settings.SENDGRID_MAX_REQUESTS_PER_SECOND
+        self._rate_limiter = AsyncRateLimiter(rate, burst=max(1, int(rate)))
+
+    @staticmethod
+    def _build_session(api_key: str) -> requests.Session:
+        """
+        Build the HTTP session used for every SendGrid request.
+
+        The SendGrid SDK opens a new urllib connection (and TLS handshake) per
+        send; a pooled session keeps connections alive across sends instead.
+        Only failures where SendGrid can't have accepted the mail are retried
+        (connection errors and 429 rate limiting), with exponential backoff
+        that honours the Retry-After header. Read timeouts and gateway errors
+        aren't retried, since the mail may already have been queued and a
+        retried POST would send it twice.
+
+        Args:
+            api_key: SendGrid API key
+
+        Returns:
+            Configured requests session
+        """
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=0,
+            other=0,
+            backoff_factor=0.5,
+            status_forcelist=[429],
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        })
+        return session
+
     def is_configured(self) -> bool:
         """Check if email service is properly configured."""
         return self.client is not None
 
+    async def _dispatch(self, message: Mail) -> requests.Response:
+        """
+        Send a message without blocking the event loop, within the rate and
+        concurrency limits.
+
+        Args:
+            message: SendGrid Mail object
+
+        Returns:
+            HTTP response from SendGrid
+        """
+        async with _SEND_SEM:
+            await self._rate_limiter.acquire()
+            return await asyncio.to_thread(self._send, message)
+
+    def _send(self, message: Mail) -> requests.Response:
+        """
+        POST a message to the SendGrid v3 mail endpoint over the pooled session.
+
+        Args:
+            message: SendGrid Mail object
+
+        Returns:
+            HTTP response from SendGrid
+        """
+        return self.client.post(
+            SENDGRID_SEND_URL,
+            json=message.get(),
+            timeout=SENDGRID_TIMEOUT_SECONDS
+        )
+
     async def send_verification_code(self, email: str, code: str) -> bool:
         """
         Send a 6-digit verification code to the user's email.
@@ -48,99 +381,18 @@ class EmailService:
 
         try:
             # Create email message
-            from_email = Email(settings.EMAIL_FROM_ADDRESS, settings.EMAIL_FROM_NAME)
             to_email = To(email)
-            subject = f"Your verification code is {code}"
+            subject = _VERIFICATION_SUBJECT_PREFIX + code
 
             # HTML content
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                    }}
-                    .container {{
-                        max-width: 600px;
-                        margin: 0 auto;
-                        padding: 20px;
-                    }}
-                    .header {{
-                        background-color: #4F46E5;
-                        color: white;
-                        padding: 20px;
-                        text-align: center;
-                        border-radius: 8px 8px 0 0;
-                    }}
-                    .content {{
-                        background-color: #f9fafb;
-                        padding: 30px;
-                        border-radius: 0 0 8px 8px;
-                    }}
-                    .code {{
-                        font-size: 32px;
-                        font-weight: bold;
-                        color: #4F46E5;
-                        letter-spacing: 8px;
-                        text-align: center;
-                        padding: 20px;
-                        background-color: white;
-                        border-radius: 8px;
-                        margin: 20px 0;
-                    }}
-                    .footer {{
-                        text-align: center;
-                        color: #666;
-                        font-size: 12px;
-                        margin-top: 20px;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>Take My Dictation</h1>
-                    </div>
-                    <div class="content">
-                        <h2>Email Verification</h2>
-                        <p>Thank you for signing up! Please use the verification code below to complete your registration:</p>
-
-                        <div class="code">{code}</div>
-
-                        <p>This code will expire in <strong>15 minutes</strong>.</p>
-
-                        <p>If you didn't request this code, you can safely ignore this email.</p>
-
-                        <div class="footer">
-                            <p>&copy; 2026 Take My Dictation. All rights reserved.</p>
-                        </div>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            html_content = _VERIFICATION_HTML_TEMPLATE.render(code=code)
 
             # Plain text content
-            text_content = f"""
-            Take My Dictation - Email Verification
-
-            Thank you for signing up!
-
-            Your verification code is: {code}
-
-            This code will expire in 15 minutes.
-
-            If you didn't request this code, you can safely ignore this email.
-
-            © 2026 Take My Dictation. All rights reserved.
-            """
+            text_content = _VERIFICATION_TEXT_TEMPLATE.render(code=code)
 
             # Create message
             message = Mail(
-                from_email=from_email,
+                from_email=self.from_email,
                 to_emails=to_email,
                 subject=subject,
                 plain_text_content=text_content,
@@ -148,13 +400,13 @@ class EmailService:
             )
 
             # Send email
-            response = self.client.send(message)
+            response = await self._dispatch(message)
 
             if response.status_code in [200, 201, 202]:
                 logger.info(f"Verification code sent successfully to {email}")
                 return True
             else:
-                logger.error(f"Failed to send email: {response.status_code} - {response.body}")
+                logger.error(f"Failed to send email: {response.status_code} - {response.text}")
                 return False
 
         except Exception as e:
@@ -166,6 +418,122 @@ class EmailService:
                 return True
             return False
 
+    async def send_bulk_verification_codes(self, recipients: List[Tuple[str, str]]) -> bool:
+        """
+        Send verification codes to many recipients with as few API calls as possible.
+
+        Recipients are grouped into one Mail per 1000 addresses, each with its
+        own personalization substituting the code into a shared body.
+
+        Args:
+            recipients: List of (email, code) pairs
+
+        Returns:
+            True if every batch was accepted, False otherwise
+        """
+        if not recipients:
+            return True
+
+        if not self.is_configured():
+            logger.warning("SendGrid not configured. Email not sent.")
+            if settings.DEBUG:
+                for email, code in recipients:
+                    logger.info(f"[DEV] Verification code for {email}: {code}")
+                return True
+            return False
+
+        all_sent = True
+        for start in range(0, len(recipients), SENDGRID_MAX_PERSONALIZATIONS):
+            batch = recipients[start:start + SENDGRID_MAX_PERSONALIZATIONS]
+            try:
+                message = Mail(
+                    from_email=self.from_email,
+                    subject=_VERIFICATION_SUBJECT_PREFIX + _CODE_TAG,
+                    plain_text_content=_BULK_VERIFICATION_TEXT,
+                    html_content=_BULK_VERIFICATION_HTML
+                )
+                for email, code in batch:
+                    personalization = Personalization()
+                    personalization.add_to(To(email))
+                    personalization.add_substitution(Substitution(_CODE_TAG, code))
+                    message.add_personalization(personalization)
+
+                response = await self._dispatch(message)
+
+                if response.status_code in [200, 201, 202]:
+                    logger.info(f"Verification codes sent successfully to {len(batch)} recipients")
+                else:
+                    logger.error(f"Failed to send bulk email: {response.status_code} - {response.text}")
+                    all_sent = False
+
+            except Exception as e:
+                logger.error(f"Error sending bulk verification email to {len(batch)} recipients: {e}")
+                all_sent = False
+
+        return all_sent
+
+    async def queue_verification_code(self, email: str, code: str) -> bool:
+        """
+        Send a verification code as part of the next coalesced batch.
+
+        Codes queued within VERIFICATION_BATCH_WINDOW_SECONDS of each other
+        go out in a single SendGrid request.
+
+        Args:
+            email: Recipient email address
+            code: 6-digit verification code
+
+        Returns:
+            True if the batch containing this code was sent, False otherwise
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_verifications.append((email, code, future))
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def enqueue_verification_code(self, email: str, code: str) -> None:
+        """
+        Deliver a verification code in the background.
+
+        Intended for FastAPI BackgroundTasks: the request returns as soon as the
+        task is scheduled, and delivery failures are logged rather than raised.
+
+        Args:
+            email: Recipient email address
+            code: 6-digit verification code
+        """
+        if not await self.queue_verification_code(email, code):
+            logger.error(f"Background delivery of verification code to {email} failed")
+
+    async def _flush_after_window(self) -> None:
+        """Wait for the batching window to close, then send everything queued."""
+        await asyncio.sleep(VERIFICATION_BATCH_WINDOW_SECONDS)
+        await self.flush_pending_verifications()
+
+    async def flush_pending_verifications(self) -> None:
+        """Send all queued verification codes now and resolve their waiters."""
+        pending = self._pending_verifications
+        self._pending_verifications = []
+        self._flush_task = None
+
+        if not pending:
+            return
+
+        try:
+            sent = await self.send_bulk_verification_codes(
+                [(email, code) for email, code, _ in pending]
+            )
+        except Exception as e:
+            logger.error(f"Error flushing verification queue: {e}")
+            sent = False
+
+        for _, _, future in pending:
+            if not future.done():
+                future.set_result(sent)
+
     async def send_welcome_email(self, email: str, name: Optional[str] = None) -> bool:
         """
         Send a welcome email after successful verification.
@@ -184,108 +552,22 @@ class EmailService:
             return False
 
         try:
-            greeting = f"Hi {name}" if name else "Welcome"
-
-            from_email = Email(settings.EMAIL_FROM_ADDRESS, settings.EMAIL_FROM_NAME)
             to_email = To(email)
-            subject = "Welcome to Take My Dictation!"
-
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                    }}
-                    .container {{
-                        max-width: 600px;
-                        margin: 0 auto;
-                        padding: 20px;
-                    }}
-                    .header {{
-                        background-color: #4F46E5;
-                        color: white;
-                        padding: 20px;
-                        text-align: center;
-                        border-radius: 8px 8px 0 0;
-                    }}
-                    .content {{
-                        background-color: #f9fafb;
-                        padding: 30px;
-                        border-radius: 0 0 8px 8px;
-                    }}
-                    .button {{
-                        display: inline-block;
-                        background-color: #4F46E5;
-                        color: white;
-                        padding: 12px 30px;
-                        text-decoration: none;
-                        border-radius: 6px;
-                        margin: 20px 0;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>Welcome to Take My Dictation!</h1>
-                    </div>
-                    <div class="content">
-                        <p>{greeting},</p>
-
-                        <p>Your email has been verified successfully! You're all set to start using Take My Dictation.</p>
-
-                        <p><strong>What's next?</strong></p>
-                        <ul>
-                            <li>Choose your subscription plan</li>
-                            <li>Start recording and get AI-powered summaries</li>
-                            <li>Export to Word or PDF</li>
-                        </ul>
-
-                        <p>If you have any questions, feel free to reach out to our support team.</p>
-
-                        <p>Happy dictating!</p>
-
-                        <p style="margin-top: 30px;">
-                            <small>&copy; 2026 Take My Dictation. All rights reserved.</small>
-                        </p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-
-            text_content = f"""
-            Welcome to Take My Dictation!
-
-            {greeting},
-
-            Your email has been verified successfully! You're all set to start using Take My Dictation.
-
-            What's next?
-            - Choose your subscription plan
-            - Start recording and get AI-powered summaries
-            - Export to Word or PDF
-
-            If you have any questions, feel free to reach out to our support team.
-
-            Happy dictating!
-
-            © 2026 Take My Dictation. All rights reserved.
-            """
+            subject = _WELCOME_SUBJECT
+
+            html_content = _WELCOME_HTML_TEMPLATE.render(name=name)
+
+            text_content = _WELCOME_TEXT_TEMPLATE.render(name=name)
 
             message = Mail(
-                from_email=from_email,
+                from_email=self.from_email,
                 to_emails=to_email,
                 subject=subject,
                 plain_text_content=text_content,
                 html_content=html_content
             )
 
-            response = self.client.send(message)
+            response = await self._dispatch(message)
 
             if response.status_code in [200, 201, 202]:
                 logger.info(f"Welcome email sent successfully to {email}")
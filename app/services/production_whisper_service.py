@@ -20,15 +20,54 @@ Version: 2.0 - Production Ready
 Date: January 2026
 """
 
+import asyncio
+import audioop
+import hashlib
+import logging
+import math
+import mimetypes
 import os
 import time
 import tempfile
+from collections import Counter, OrderedDict
 from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
-from openai import AsyncOpenAI
-from pydub import AudioSegment
+import av
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# verbose_json reports the detected language by name, while the `language`
+# request parameter takes an ISO-639-1 code
+WHISPER_LANGUAGE_CODES = {
+    'afrikaans': 'af', 'arabic': 'ar', 'armenian': 'hy', 'azerbaijani': 'az',
+    'belarusian': 'be', 'bosnian': 'bs', 'bulgarian': 'bg', 'catalan': 'ca',
+    'chinese': 'zh', 'croatian': 'hr', 'czech': 'cs', 'danish': 'da',
+    'dutch': 'nl', 'english': 'en', 'estonian': 'et', 'finnish': 'fi',
+    'french': 'fr', 'galician': 'gl', 'german': 'de', 'greek': 'el',
+    'hebrew': 'he', 'hindi': 'hi', 'hungarian': 'hu', 'icelandic': 'is',
+    'indonesian': 'id', 'italian': 'it', 'japanese': 'ja', 'kannada': 'kn',
+    'kazakh': 'kk', 'korean': 'ko', 'latvian': 'lv', 'lithuanian': 'lt',
+    'macedonian': 'mk', 'malay': 'ms', 'marathi': 'mr', 'maori': 'mi',
+    'nepali': 'ne', 'norwegian': 'no', 'persian': 'fa', 'polish': 'pl',
+    'portuguese': 'pt', 'romanian': 'ro', 'russian': 'ru', 'serbian': 'sr',
+    'slovak': 'sk', 'slovenian': 'sl', 'spanish': 'es', 'swahili': 'sw',
+    'swedish': 'sv', 'tagalog': 'tl', 'tamil': 'ta', 'thai': 'th',
+    'turkish': 'tr', 'ukrainian': 'uk', 'urdu': 'ur', 'vietnamese': 'vi',
+    'welsh': 'cy',
+}
+
+
+WHISPER_TRANSCRIPTIONS_URL = "https://api.openai.com/v1/audio/transcriptions"
+
+# Shared, connection-pooled client for Whisper uploads. Multipart bodies are
+# streamed from the open file in chunks rather than buffered in memory.
+_WHISPER_HTTP = httpx.AsyncClient(
+    timeout=httpx.Timeout(120.0, connect=10.0),
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+)
 
 
 class TranscriptionQuality(Enum):
@@ -40,9 +79,9 @@ class TranscriptionQuality(Enum):
     FAILED = "failed"       # Could not transcribe
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionResult:
-    """Structured result from transcription"""
+    """Structured result from transcription (immutable, so cached results can be shared)"""
     transcript: Optional[str]
     language: Optional[str]
     quality: TranscriptionQuality
@@ -76,6 +115,80 @@ class AudioPreprocessor:
     # Maximum file size for Whisper API (25MB)
     MAX_FILE_SIZE_MB = 25
 
+    # Decoded PCM layout (16-bit mono) and peak normalization headroom
+    SAMPLE_WIDTH = 2
+    MAX_AMPLITUDE = 32768
+    NORMALIZE_HEADROOM_DB = 0.1
+
+    # Opus speech encoding: 24kbps voice-tuned Opus matches 64-96kbps MP3 for
+    # speech at a fraction of the upload size. 12kbps floor for long recordings.
+    OPUS_BITRATE_KBPS = 24
+    MIN_OPUS_BITRATE_KBPS = 12
+
+    # Samples per frame handed to the encoder (one second at 16kHz)
+    ENCODE_FRAME_SAMPLES = 16000
+
+    @staticmethod
+    def _decode_mono(input_path: str) -> Tuple[bytes, int, int]:
+        """
+        Decode audio in-process to 16-bit mono PCM at Whisper's 16kHz.
+
+        The downmix and resample happen in libswresample as frames are decoded.
+
+        Returns:
+            (pcm_bytes, original_sample_rate, original_channels)
+        """
+        with av.open(input_path) as container:
+            stream = container.streams.audio[0]
+            sample_rate = stream.codec_context.sample_rate
+            channels = stream.codec_context.channels
+            resampler = av.AudioResampler(
+                format='s16',
+                layout='mono',
+                rate=AudioPreprocessor.WHISPER_SAMPLE_RATE
+            )
+
+            chunks = []
+            for frame in container.decode(stream):
+                for resampled in resampler.resample(frame):
+                    chunks.append(bytes(resampled.planes[0])[:resampled.samples * 2])
+            for resampled in resampler.resample(None):
+                chunks.append(bytes(resampled.planes[0])[:resampled.samples * 2])
+
+        return b''.join(chunks), sample_rate, channels
+
+    @classmethod
+    def _encode_opus(cls, pcm: bytes, bit_rate: int, output_path: str) -> None:
+        """
+        Encode 16kHz 16-bit mono PCM to Opus in a WebM container with libopus.
+
+        Args:
+            pcm: Raw 16-bit mono samples at WHISPER_SAMPLE_RATE
+            bit_rate: Target bitrate in bits per second
+            output_path: Destination file
+        """
+        sample_rate = cls.WHISPER_SAMPLE_RATE
+
+        with av.open(output_path, 'w', format='webm') as container:
+            stream = container.add_stream('libopus', rate=sample_rate, layout='mono')
+            stream.bit_rate = bit_rate
+            stream.options = {'application': 'voip'}  # Tune for speech
+
+            step = cls.ENCODE_FRAME_SAMPLES * cls.SAMPLE_WIDTH
+            pts = 0
+            for offset in range(0, len(pcm), step):
+                chunk = pcm[offset:offset + step]
+                samples = len(chunk) // cls.SAMPLE_WIDTH
+                frame = av.AudioFrame(format='s16', layout='mono', samples=samples)
+                frame.planes[0].update(chunk)
+                frame.sample_rate = sample_rate
+                frame.pts = pts
+                pts += samples
+                container.mux(stream.encode(frame))
+
+            # Flush frames still buffered in the encoder
+            container.mux(stream.encode(None))
+
     @classmethod
     async def prepare_audio(cls, input_path: str, output_path: Optional[str] = None) -> Tuple[str, Dict]:
         """
@@ -121,65 +234,69 @@ class AudioPreprocessor:
         # If no processing needed, return original
         if not needs_processing:
             metadata['was_processed'] = False
-            print(f"📄 Audio file OK - no preprocessing needed")
+            logger.debug("📄 Audio file OK - no preprocessing needed")
             return input_path, metadata
 
         # Process the audio
         if output_path is None:
-            output_path = tempfile.NamedTemporaryFile(suffix='.mp3', delete=False).name
+            output_path = tempfile.NamedTemporaryFile(suffix='.webm', delete=False).name
 
         try:
-            print(f"⚙️  Minimal preprocessing (Whisper-optimized)...")
-            audio = AudioSegment.from_file(input_path)
-            metadata['duration_seconds'] = len(audio) / 1000.0
-            metadata['original_channels'] = audio.channels
-            metadata['original_sample_rate'] = audio.frame_rate
-            metadata['original_dbfs'] = round(audio.dBFS, 1)
+            logger.debug("⚙️  Minimal preprocessing (Whisper-optimized)...")
+            pcm, sample_rate, channels = cls._decode_mono(input_path)
+            duration_seconds = len(pcm) / cls.SAMPLE_WIDTH / cls.WHISPER_SAMPLE_RATE
+            rms = audioop.rms(pcm, cls.SAMPLE_WIDTH)
+            original_dbfs = 20 * math.log10(rms / cls.MAX_AMPLITUDE) if rms else -float('inf')
+
+            metadata['duration_seconds'] = duration_seconds
+            metadata['original_channels'] = channels
+            metadata['original_sample_rate'] = sample_rate
+            metadata['original_dbfs'] = round(original_dbfs, 1)
 
             # Only normalize if EXTREMELY quiet (< -30 dBFS)
             # This is conservative - most audio doesn't need this
-            if audio.dBFS < -30:
-                from pydub.effects import normalize
-                audio = normalize(audio)
+            peak = audioop.max(pcm, cls.SAMPLE_WIDTH)
+            if original_dbfs < -30 and peak:
+                target_peak = cls.MAX_AMPLITUDE * 10 ** (-cls.NORMALIZE_HEADROOM_DB / 20)
+                pcm = audioop.mul(pcm, cls.SAMPLE_WIDTH, target_peak / peak)
                 metadata['processing_steps'].append('normalize_volume')
                 metadata['normalized_from_dbfs'] = metadata['original_dbfs']
-                print(f"   - Normalized extremely quiet audio ({metadata['original_dbfs']}dB → louder)")
+                logger.debug("   - Normalized extremely quiet audio (%sdB → louder)", metadata['original_dbfs'])
 
-            # Convert to mono if stereo (saves space, Whisper works better)
-            if audio.channels > 1:
-                audio = audio.set_channels(1)
+            # Decoding already downmixed to mono (saves space, Whisper works better)
+            if channels > 1:
                 metadata['processing_steps'].append('convert_to_mono')
-                print(f"   - Converted to mono")
+                logger.debug("   - Converted to mono")
 
             # Calculate target bitrate based on file size
-            duration_seconds = len(audio) / 1000.0
             if file_size_mb > cls.MAX_FILE_SIZE_MB:
                 # Target 20MB to be safe (in bits)
                 target_size_bits = 20 * 1024 * 1024 * 8
                 target_bitrate = int(target_size_bits / duration_seconds / 1000)
-                # Clamp between 64k and 128k
-                target_bitrate = max(64, min(128, target_bitrate))
-                bitrate = f"{target_bitrate}k"
-                print(f"   - Compressing to {bitrate} (file was {file_size_mb:.1f}MB)")
+                # Clamp between the Opus floor and the default speech bitrate
+                target_bitrate = max(cls.MIN_OPUS_BITRATE_KBPS, min(cls.OPUS_BITRATE_KBPS, target_bitrate))
+                logger.debug("   - Compressing to %sk (file was %.1fMB)", target_bitrate, file_size_mb)
             else:
-                # Default to 128k for quality
-                bitrate = "128k"
+                # Default speech bitrate
+                target_bitrate = cls.OPUS_BITRATE_KBPS
+
+            bitrate = f"{target_bitrate}k"
 
             metadata['output_bitrate'] = bitrate
 
             # Export
-            audio.export(output_path, format="mp3", bitrate=bitrate)
+            cls._encode_opus(pcm, target_bitrate * 1000, output_path)
 
             metadata['was_processed'] = True
             metadata['output_size_mb'] = round(os.path.getsize(output_path) / (1024 * 1024), 2)
 
-            print(f"   ✅ Preprocessing complete: {metadata['output_size_mb']}MB")
+            logger.debug("   ✅ Preprocessing complete: %sMB", metadata['output_size_mb'])
 
             return output_path, metadata
 
         except Exception as e:
             metadata['error'] = str(e)
-            print(f"   ⚠️  Preprocessing failed: {e}")
+            logger.warning("⚠️  Preprocessing failed: %s", e)
             # Return original on failure - let Whisper try anyway
             return input_path, metadata
 
@@ -194,6 +311,9 @@ class RepetitionDetector:
     - Transcript ending mid-word with repetition
     """
 
+    # N-gram sizes checked for repeated phrases, in priority order
+    NGRAM_SIZES = (4, 3, 5)
+
     @staticmethod
     def detect(text: str) -> Tuple[bool, Optional[str]]:
         """
@@ -212,13 +332,13 @@ class RepetitionDetector:
             return False, None
 
         # Strategy 1: Look for repeated N-grams (N=3,4,5)
-        for n in [4, 3, 5]:
-            for i in range(len(words) - n * 3):
-                phrase = ' '.join(words[i:i+n])
-                remaining = ' '.join(words[i+n:])
-                count = remaining.count(phrase)
-                if count >= 2:  # Original + 2 more = 3 total
-                    return True, phrase[:50]
+        # One hash-counting pass per N over word tuples, rather than re-joining
+        # and re-scanning the rest of the transcript at every position
+        for n in RepetitionDetector.NGRAM_SIZES:
+            ngrams = Counter(zip(*(words[i:] for i in range(n))))
+            for ngram, count in ngrams.items():
+                if count >= 3:  # Original + 2 more
+                    return True, ' '.join(ngram)[:50]
 
         # Strategy 2: Check last 25% for loops
         last_quarter = text[int(len(text) * 0.75):]
@@ -244,7 +364,7 @@ class RepetitionDetector:
         return False, None
 
     @staticmethod
-    def calculate_quality_score(text: str) -> float:
+    def calculate_quality_score(text: str, has_rep: Optional[bool] = None) -> float:
         """
         Calculate a quality score (0.0 to 1.0) for the transcript.
 
@@ -252,6 +372,11 @@ class RepetitionDetector:
         - Repetition (major penalty)
         - Word diversity
         - Reasonable length
+
+        Args:
+            text: Transcript to score
+            has_rep: Result of RepetitionDetector.detect if already known;
+                     detected here when None
         """
         if not text:
             return 0.0
@@ -259,7 +384,8 @@ class RepetitionDetector:
         score = 1.0
 
         # Check repetition (heavy penalty)
-        has_rep, _ = RepetitionDetector.detect(text)
+        if has_rep is None:
+            has_rep, _ = RepetitionDetector.detect(text)
         if has_rep:
             score -= 0.5
 
@@ -274,7 +400,9 @@ class RepetitionDetector:
 
         # Check for garbled characters (common in bad transcripts)
         # This is language-agnostic - looks for unusual patterns
-        unusual_chars = sum(1 for c in text if ord(c) > 0xFFFF)
+        # Characters outside the BMP encode as surrogate pairs in UTF-16, so the
+        # count falls out of the encoded length without a per-character loop
+        unusual_chars = len(text.encode('utf-16-le')) // 2 - len(text)
         if unusual_chars > len(text) * 0.1:
             score -= 0.2
 
@@ -297,21 +425,41 @@ class ProductionWhisperService:
     # Start balanced, then try extremes
     TEMPERATURE_SEQUENCE = [0.2, 0.0, 0.4, 0.3, 0.6]
 
-    def __init__(self, api_key: str):
+    # Stop retrying once a repetition-free attempt scores at least this much
+    GOOD_ENOUGH_SCORE = 0.75
+
+    # Retry temperatures run in waves of at most this many concurrent Whisper
+    # calls, so a bad recording doesn't fire every paid attempt at once
+    MAX_CONCURRENT_ATTEMPTS = 2
+
+    # Transcripts longer than this are scored in a worker thread so a
+    # multi-hour recording doesn't stall the event loop
+    OFFLOAD_SCORING_CHARS = 20_000
+
+    # Successful results kept per process, keyed by (audio sha256, language),
+    # so re-submitted clips don't hit the Whisper API again
+    RESULT_CACHE_SIZE = 256
+    _result_cache: "OrderedDict[Tuple[str, Optional[str]], TranscriptionResult]" = OrderedDict()
+
+    def __init__(self, api_key: str, speculative_retries: bool = False):
         """
         Initialize the service.
 
         Args:
             api_key: OpenAI API key
+            speculative_retries: Send the first two temperatures concurrently
+                                 instead of waiting to see if the first one repeats
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.api_key = api_key
+        self.speculative_retries = speculative_retries
         self.preprocessor = AudioPreprocessor()
 
     async def transcribe(
         self,
         audio_path: str,
         language: Optional[str] = None,
-        max_retries: int = 5
+        max_retries: int = 5,
+        audio_hash: Optional[str] = None
     ) -> TranscriptionResult:
         """
         Transcribe audio file.
@@ -321,6 +469,7 @@ class ProductionWhisperService:
             language: Optional ISO language code (e.g., 'en', 'hi', 'es')
                      If None, Whisper auto-detects (recommended)
             max_retries: Maximum transcription attempts
+            audio_hash: hash_file() digest of audio_path, if the caller already has it
 
         Returns:
             TranscriptionResult with transcript and metadata
@@ -330,7 +479,19 @@ class ProductionWhisperService:
         processed_path = None
 
         try:
-            print(f"\n🎙️  Starting production transcription...")
+            logger.debug("🎙️  Starting production transcription...")
+
+            # Step 0: Return a cached result for audio we've already transcribed
+            cache_key = (audio_hash or await self.hash_file(audio_path), language)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                logger.debug("   ♻️  Identical audio already transcribed, using cached result")
+                return replace(
+                    cached,
+                    processing_time_seconds=time.time() - start_time,
+                    warnings=list(cached.warnings)
+                )
 
             # Step 1: Preprocess audio (minimal)
             processed_path, prep_metadata = await self.preprocessor.prepare_audio(audio_path)
@@ -340,14 +501,14 @@ class ProductionWhisperService:
 
             duration = prep_metadata.get('duration_seconds', 0)
             if duration == 0:
-                # Get duration from processed file
+                # Get duration from processed file's container header
                 try:
-                    audio = AudioSegment.from_file(processed_path)
-                    duration = len(audio) / 1000.0
+                    with av.open(processed_path) as container:
+                        duration = container.duration / av.time_base
                 except:
                     duration = 60  # Default assumption
 
-            print(f"   Duration: {duration:.1f}s")
+            logger.debug("   Duration: %.1fs", duration)
 
             # Step 2: Try transcription with different temperatures
             best_result = None
@@ -356,58 +517,102 @@ class ProductionWhisperService:
 
             temperatures_to_try = self.TEMPERATURE_SEQUENCE[:max_retries]
 
-            print(f"🔄 Multi-temperature retry strategy: {temperatures_to_try}")
-
-            for temp in temperatures_to_try:
-                attempts += 1
+            logger.debug("🔄 Multi-temperature retry strategy: %s", temperatures_to_try)
 
+            async def attempt(temp: float):
+                """Run one Whisper call, returning (temp, result, error) instead of raising."""
                 try:
-                    print(f"   Attempt {attempts}/{len(temperatures_to_try)} (temp={temp})...")
-
                     result = await self._call_whisper(
                         processed_path,
                         temperature=temp,
                         language=language
                     )
-
-                    if result is None:
-                        continue
-
-                    transcript, detected_lang = result
-
-                    # Check quality
-                    has_repetition, repeated = RepetitionDetector.detect(transcript)
-                    quality_score = RepetitionDetector.calculate_quality_score(transcript)
-
-                    print(f"      Quality: {quality_score:.2f}, Repetition: {has_repetition}")
-
-                    # Track best result
-                    if quality_score > best_score:
-                        best_score = quality_score
-                        best_result = {
-                            'transcript': transcript,
-                            'language': detected_lang,
-                            'temperature': temp,
-                            'quality_score': quality_score,
-                            'has_repetition': has_repetition
-                        }
-
-                    # If good enough, stop trying
-                    if quality_score >= 0.8 and not has_repetition:
-                        print(f"      ✅ Excellent quality achieved, stopping retries")
-                        break
-
-                    # If we found repetition, try next temperature
-                    if has_repetition:
-                        warnings.append(f"Repetition detected at temp={temp}, retrying...")
-                        print(f"      ⚠️  Repetition detected: '{repeated[:40]}...'")
-                        continue
-
+                    return temp, result, None
                 except Exception as e:
-                    warnings.append(f"API error at temp={temp}: {str(e)[:50]}")
-                    print(f"      ❌ Error: {str(e)[:50]}")
-                    time.sleep(1)
-                    continue
+                    return temp, None, e
+
+            # The first temperature runs alone - most transcriptions stop there,
+            # and its detected language is pinned for the retries. The remaining
+            # temperatures then run in waves of MAX_CONCURRENT_ATTEMPTS, and a
+            # clean result ends the retries before the next wave is paid for.
+            # With speculative retries the first two go out together and the
+            # first clean result wins, trading API cost for tail latency.
+            lead = 2 if self.speculative_retries else 1
+            retry_temperatures = temperatures_to_try[lead:]
+            waves = [temperatures_to_try[:lead]] + [
+                retry_temperatures[i:i + self.MAX_CONCURRENT_ATTEMPTS]
+                for i in range(0, len(retry_temperatures), self.MAX_CONCURRENT_ATTEMPTS)
+            ]
+            good_enough = False
+            backoff = 0.0
+            for batch in waves:
+                if good_enough or not batch:
+                    break
+
+                # Give a rate-limited or failing API a moment before retrying
+                if backoff:
+                    await asyncio.sleep(backoff)
+                    backoff = 0.0
+
+                tasks = [asyncio.create_task(attempt(temp)) for temp in batch]
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        temp, result, error = await next_done
+                        attempts += 1
+                        logger.debug("   Attempt %d/%d (temp=%s)...", attempts, len(temperatures_to_try), temp)
+
+                        if error is not None:
+                            warnings.append(f"API error at temp={temp}: {str(error)[:50]}")
+                            logger.warning("❌ Whisper error at temp=%s: %.50s", temp, error)
+                            if self._is_retriable(error):
+                                backoff = max(backoff, min(2 ** attempts * 0.5, 8))
+                            continue
+
+                        if result is None:
+                            continue
+
+                        transcript, detected_lang = result
+
+                        # Later attempts reuse the detected language instead of
+                        # paying for language identification again
+                        if language is None and detected_lang:
+                            language = WHISPER_LANGUAGE_CODES.get(detected_lang.lower())
+
+                        # Check quality
+                        if len(transcript or '') > self.OFFLOAD_SCORING_CHARS:
+                            has_repetition, repeated, quality_score = await asyncio.to_thread(
+                                self._score_transcript, transcript
+                            )
+                        else:
+                            has_repetition, repeated, quality_score = self._score_transcript(transcript)
+
+                        logger.debug("      Quality: %.2f, Repetition: %s", quality_score, has_repetition)
+
+                        # Track best result
+                        if quality_score > best_score:
+                            best_score = quality_score
+                            best_result = {
+                                'transcript': transcript,
+                                'language': detected_lang,
+                                'temperature': temp,
+                                'quality_score': quality_score,
+                                'has_repetition': has_repetition
+                            }
+
+                        # If good enough, stop trying
+                        if quality_score >= self.GOOD_ENOUGH_SCORE and not has_repetition:
+                            logger.debug("      ✅ Good quality achieved, stopping retries")
+                            good_enough = True
+                            break
+
+                        # If we found repetition, keep waiting on other temperatures
+                        if has_repetition:
+                            warnings.append(f"Repetition detected at temp={temp}, retrying...")
+                            logger.debug("      ⚠️  Repetition detected: '%.40s...'", repeated)
+                finally:
+                    # Drop attempts still in flight once we have a good result
+                    for task in tasks:
+                        task.cancel()
 
             # Step 3: Determine final quality
             if best_result is None:
@@ -439,14 +644,18 @@ class ProductionWhisperService:
             if best_result['has_repetition']:
                 warnings.append("Warning: Some repetition detected in best result")
 
-            print(f"\n✅ Transcription complete!")
-            print(f"   Language: {best_result['language']}")
-            print(f"   Quality: {quality.value} (score: {best_score:.2f})")
-            print(f"   Temperature used: {best_result['temperature']}")
-            print(f"   Attempts: {attempts}")
-            print(f"   Time: {time.time() - start_time:.1f}s")
+            logger.debug(
+                "✅ Transcription complete (language: %s, quality: %s, score: %.2f, "
+                "temperature: %s, attempts: %d, time: %.1fs)",
+                best_result['language'],
+                quality.value,
+                best_score,
+                best_result['temperature'],
+                attempts,
+                time.time() - start_time
+            )
 
-            return TranscriptionResult(
+            result = TranscriptionResult(
                 transcript=best_result['transcript'],
                 language=best_result['language'],
                 quality=quality,
@@ -459,8 +668,14 @@ class ProductionWhisperService:
                 error=None
             )
 
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+            return result
+
         except Exception as e:
-            print(f"❌ Transcription failed: {str(e)}")
+            logger.error("❌ Transcription failed: %s", e)
             return TranscriptionResult(
                 transcript=None,
                 language=None,
@@ -482,6 +697,48 @@ class ProductionWhisperService:
                 except:
                     pass
 
+    @staticmethod
+    def _is_retriable(error: Exception) -> bool:
+        """
+        Whether a failed Whisper call is worth backing off and retrying.
+
+        Rate limiting, server errors and network failures are transient;
+        anything else (bad request, auth, programming errors) is not.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return isinstance(error, httpx.TransportError)
+
+    @staticmethod
+    def _score_transcript(transcript: str) -> Tuple[bool, Optional[str], float]:
+        """
+        Run repetition detection and quality scoring on one transcript.
+
+        Returns:
+            (has_repetition, repeated_phrase, quality_score)
+        """
+        has_repetition, repeated = RepetitionDetector.detect(transcript)
+        quality_score = RepetitionDetector.calculate_quality_score(transcript, has_rep=has_repetition)
+        return has_repetition, repeated, quality_score
+
+    @staticmethod
+    async def hash_file(path: str) -> str:
+        """
+        SHA-256 of a file's contents, computed off the event loop.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Hex digest
+        """
+        def _digest() -> str:
+            with open(path, 'rb') as f:
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        return await asyncio.to_thread(_digest)
+
     async def _call_whisper(
         self,
         audio_path: str,
@@ -491,32 +748,39 @@ class ProductionWhisperService:
         """
         Make a single Whisper API call.
 
+        The file is streamed to the API as a multipart upload, so concurrent
+        attempts don't each hold a full copy of the audio in memory.
+
+        Args:
+            audio_path: Path to the audio file to upload
+            temperature: Sampling temperature
+            language: Optional ISO language code
+
         Returns:
             (transcript, language) or None on failure
         """
-        import aiofiles
-        from io import BytesIO
-
-        async with aiofiles.open(audio_path, 'rb') as audio_file:
-            audio_data = await audio_file.read()
-
-        # Create in-memory file for API
-        audio_buffer = BytesIO(audio_data)
-        audio_buffer.name = audio_path
-
         # Build parameters
-        params = {
+        data = {
             'model': 'whisper-1',
-            'file': audio_buffer,
             'response_format': 'verbose_json',
-            'temperature': temperature
+            'temperature': str(temperature)
         }
 
         # Only set language if explicitly requested
         # Auto-detection is usually better
         if language:
-            params['language'] = language
+            data['language'] = language
 
-        response = await self.client.audio.transcriptions.create(**params)
+        content_type = mimetypes.guess_type(audio_path)[0] or 'application/octet-stream'
+
+        with open(audio_path, 'rb') as audio_file:
+            response = await _WHISPER_HTTP.post(
+                WHISPER_TRANSCRIPTIONS_URL,
+                headers={'Authorization': f'Bearer {self.api_key}'},
+                data=data,
+                files={'file': (os.path.basename(audio_path), audio_file, content_type)}
+            )
+        response.raise_for_status()
 
-        return response.text, response.language
+        body = response.json()
+        return body.get('text'), body.get('language')
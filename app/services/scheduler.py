@@ -4,14 +4,11 @@ Handles monthly usage resets and other scheduled jobs.
 """
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from datetime import datetime, date
-from typing import List
+from datetime import date
 import logging
+import threading
 
-from app.db.database import get_async_session
-from app.models.user import User
+from app.db.database import AsyncSessionLocal
 from app.services.usage_tracking_service import UsageTrackingService
 from app.services.audio_retention_service import AudioRetentionService
 
@@ -35,55 +32,29 @@ class BackgroundScheduler:
         logger.info("🔄 Starting monthly usage reset job...")
 
         try:
-            # Get database session
-            async for db in get_async_session():
+            async with AsyncSessionLocal() as db:
                 today = date.today()
-                current_day = today.day
-
-                # Find users whose subscription anniversary is today
-                # and who are not trial users
-                result = await db.execute(
-                    select(User).filter(
-                        User.subscription_anniversary_date == current_day,
-                        User.is_trial_user == False
-                    )
+
+                # Reset every paid user whose subscription anniversary is
+                # today in a single UPDATE
+                reset_users = await self.usage_service.reset_monthly_usage_for_day(
+                    today.day,
+                    db
                 )
-                users_to_reset = result.scalars().all()
-
-                logger.info(f"📊 Found {len(users_to_reset)} users to reset")
-
-                reset_count = 0
-                for user in users_to_reset:
-                    try:
-                        reset_result = await self.usage_service.reset_monthly_usage(
-                            user.id,
-                            db
-                        )
-
-                        if reset_result["success"]:
-                            logger.info(
-                                f"✅ Reset usage for {user.email}: "
-                                f"{reset_result['old_usage_hours']:.2f}h → 0h"
-                            )
-                            reset_count += 1
-                        else:
-                            logger.warning(
-                                f"⚠️  Skipped reset for {user.email}: {reset_result.get('message')}"
-                            )
-
-                    except Exception as user_error:
-                        logger.error(
-                            f"❌ Failed to reset usage for {user.email}: {user_error}"
-                        )
-                        continue
-
-                logger.info(f"✅ Monthly usage reset complete: {reset_count}/{len(users_to_reset)} users reset")
-
-                # Break after first session (we only need one)
-                break
+
+            # One summary record per run; per-user detail only when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                for reset in reset_users:
+                    logger.debug(
+                        "Reset usage for %s: %.2fh -> 0h",
+                        reset['email'],
+                        reset['old_usage_hours']
+                    )
+
+            logger.info("✅ Monthly usage reset complete: %d users reset", len(reset_users))
 
         except Exception as e:
-            logger.error(f"❌ Monthly usage reset job failed: {e}")
+            logger.error("❌ Monthly usage reset job failed: %s", e)
 
     async def cleanup_expired_audio_job(self):
         """
@@ -93,21 +64,18 @@ class BackgroundScheduler:
         logger.info("🗑️  Starting audio cleanup job...")
 
         try:
-            # Get database session
-            async for db in get_async_session():
+            async with AsyncSessionLocal() as db:
                 cleanup_result = await self.retention_service.cleanup_expired_audio(db)
 
-                logger.info(
-                    f"✅ Audio cleanup complete: {cleanup_result['deleted_count']} files deleted, "
-                    f"{cleanup_result['failed_count']} failed, "
-                    f"{cleanup_result['total_size_freed_mb']} MB freed"
-                )
-
-                # Break after first session (we only need one)
-                break
+            logger.info(
+                "✅ Audio cleanup complete: %s files deleted, %s failed, %s MB freed",
+                cleanup_result['deleted_count'],
+                cleanup_result['failed_count'],
+                cleanup_result['total_size_freed_mb']
+            )
 
         except Exception as e:
-            logger.error(f"❌ Audio cleanup job failed: {e}")
+            logger.error("❌ Audio cleanup job failed: %s", e)
 
     def start(self):
         """Start the scheduler with all jobs."""
@@ -146,27 +114,35 @@ class BackgroundScheduler:
         logger.info("✅ Background scheduler stopped")
 
 
-# Global scheduler instance
+# Global scheduler instance. The lock is reentrant (start_scheduler holds it
+# while calling get_scheduler) and thread-level, so lifespans running on
+# separate event loops can't create or start a second scheduler.
 _scheduler_instance = None
+_scheduler_lock = threading.RLock()
 
 
 def get_scheduler() -> BackgroundScheduler:
     """Get the global scheduler instance."""
     global _scheduler_instance
-    if _scheduler_instance is None:
-        _scheduler_instance = BackgroundScheduler()
-    return _scheduler_instance
+    with _scheduler_lock:
+        if _scheduler_instance is None:
+            _scheduler_instance = BackgroundScheduler()
+        return _scheduler_instance
 
 
 async def start_scheduler():
-    """Start the global scheduler."""
-    scheduler = get_scheduler()
-    scheduler.start()
+    """Start the global scheduler. Does nothing if it is already running."""
+    with _scheduler_lock:
+        scheduler = get_scheduler()
+        if not scheduler.scheduler.running:
+            scheduler.start()
 
 
 async def stop_scheduler():
-    """Stop the global scheduler."""
+    """Stop the global scheduler. Does nothing if it isn't running."""
     global _scheduler_instance
-    if _scheduler_instance is not None:
-        _scheduler_instance.shutdown()
-        _scheduler_instance = None
+    with _scheduler_lock:
+        if _scheduler_instance is not None:
+            if _scheduler_instance.scheduler.running:
+                _scheduler_instance.shutdown()
+            _scheduler_instance = None
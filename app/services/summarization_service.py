@@ -4,62 +4,63 @@ Generates structured summaries in various formats with NO truncation.
 """
 from openai import AsyncOpenAI
 from typing import Dict, Optional
+import httpx
+import logging
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
 
-class SummarizationService:
-    """
-    Production-ready summarization service.
-    Generates complete summaries without truncation.
-    """
 
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize summarization service.
+# One client (and connection pool) per process, created on first use
+_openai_client: Optional[AsyncOpenAI] = None
 
-        Args:
-            api_key: OpenAI API key (defaults to settings)
-        """
-        self.client = AsyncOpenAI(api_key=api_key or settings.OPENAI_API_KEY)
 
-    async def generate_summary(
-        self,
-        transcript: str,
-        format_type: str,
-        detected_language: Optional[str] = None
-    ) -> Dict[str, any]:
-        """
-        Generate summary with NO truncation.
+def _get_client() -> AsyncOpenAI:
+    """
+    Return the process-wide OpenAI client, creating it on first use.
 
-        Args:
-            transcript: Transcribed text
-            format_type: One of: meeting_notes, product_spec, mom, quick_summary
-            detected_language: Auto-detected language code (e.g., 'hi', 'en')
+    Returns:
+        Shared AsyncOpenAI client
+    """
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            # Keep idle connections for a minute (httpx defaults to 5s) so
+            # bursts of summaries reuse warm TLS connections
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0
+                )
+            )
+        )
+    return _openai_client
 
-        Returns:
-            {
-                'summary_text': str,
-                'format_type': str,
-                'success': bool,
-                'finish_reason': str,
-                'error': str (if any)
-            }
-        """
 
-        # Language-aware context
-        if detected_language and detected_language != 'en':
-            language_note = f"""
+SYSTEM_PROMPT = """You are a professional summarization assistant.
+
+CRITICAL RULES:
+1. ONLY use information present in the transcript
+2. If the transcript has errors or is unclear, acknowledge this
+3. Do NOT hallucinate or make up details
+4. If you cannot understand parts of the transcript, say "This section is unclear"
+5. Always complete your response - never stop mid-sentence
+6. Be thorough and comprehensive - do not rush to finish"""
+
+LANGUAGE_NOTE_TEMPLATE = """
 IMPORTANT: This transcript is in {detected_language}.
 - Preserve key terms and proper nouns in their original language
 - Provide the summary in English
 - If the transcript is unclear, note which parts are uncertain
 """
-        else:
-            language_note = ""
 
-        # Prompts with clear structure
-        prompts = {
-            "meeting_notes": f"""
+# Prompts with clear structure, keyed by format type.
+# Placeholders: {language_note}, {transcript}
+PROMPT_TEMPLATES = {
+    "meeting_notes": """
 {language_note}
 Convert this transcript into structured meeting notes.
 
@@ -88,7 +89,7 @@ TRANSCRIPT:
 {transcript}
 """,
 
-            "product_spec": f"""
+    "product_spec": """
 {language_note}
 Convert this transcript into a product specification document.
 
@@ -118,7 +119,7 @@ TRANSCRIPT:
 {transcript}
 """,
 
-            "mom": f"""
+    "mom": """
 {language_note}
 Convert this transcript into formal Minutes of Meeting.
 
@@ -150,7 +151,7 @@ TRANSCRIPT:
 {transcript}
 """,
 
-            "quick_summary": f"""
+    "quick_summary": """
 {language_note}
 Provide a concise summary of this transcript.
 
@@ -173,9 +174,83 @@ FORMAT:
 TRANSCRIPT:
 {transcript}
 """
-        }
+}
 
-        prompt = prompts.get(format_type, prompts["quick_summary"])
+# Output token ceiling per format; the detailed formats keep a large budget so
+# long meetings aren't truncated
+MAX_TOKENS_BY_FORMAT = {
+    "meeting_notes": 4000,
+    "product_spec": 4000,
+    "mom": 4000,
+    "quick_summary": 1000,
+}
+
+# Transcripts with fewer non-whitespace characters than this (typically a
+# failed transcription) are not sent to the model
+MIN_TRANSCRIPT_CHARS = 20
+
+
+class SummarizationService:
+    """
+    Production-ready summarization service.
+    Generates complete summaries without truncation.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, client: Optional[AsyncOpenAI] = None):
+        """
+        Initialize summarization service.
+
+        Args:
+            api_key: OpenAI API key (defaults to settings)
+            client: Optional client to use instead of the shared one
+        """
+        if client is not None:
+            self.client = client
+        elif api_key and api_key != settings.OPENAI_API_KEY:
+            self.client = AsyncOpenAI(api_key=api_key)
+        else:
+            self.client = _get_client()
+
+    async def generate_summary(
+        self,
+        transcript: str,
+        format_type: str,
+        detected_language: Optional[str] = None
+    ) -> Dict[str, any]:
+        """
+        Generate summary with NO truncation.
+
+        Args:
+            transcript: Transcribed text
+            format_type: One of: meeting_notes, product_spec, mom, quick_summary
+            detected_language: Auto-detected language code (e.g., 'hi', 'en')
+
+        Returns:
+            {
+                'summary_text': str,
+                'format_type': str,
+                'success': bool,
+                'finish_reason': str,
+                'error': str (if any)
+            }
+        """
+        if not transcript or len("".join(transcript.split())) < MIN_TRANSCRIPT_CHARS:
+            return {
+                'summary_text': "[Transcript too short to summarize]",
+                'format_type': format_type,
+                'success': True,
+                'finish_reason': 'skipped'
+            }
+
+        # Language-aware context
+        if detected_language and detected_language != 'en':
+            language_note = LANGUAGE_NOTE_TEMPLATE.format(detected_language=detected_language)
+        else:
+            language_note = ""
+
+        # Only the selected prompt is formatted
+        template = PROMPT_TEMPLATES.get(format_type, PROMPT_TEMPLATES["quick_summary"])
+        prompt = template.format(language_note=language_note, transcript=transcript)
 
         try:
             response = await self.client.chat.completions.create(
@@ -183,15 +258,7 @@ TRANSCRIPT:
                 messages=[
                     {
                         "role": "system",
-                        "content": """You are a professional summarization assistant.
-
-CRITICAL RULES:
-1. ONLY use information present in the transcript
-2. If the transcript has errors or is unclear, acknowledge this
-3. Do NOT hallucinate or make up details
-4. If you cannot understand parts of the transcript, say "This section is unclear"
-5. Always complete your response - never stop mid-sentence
-6. Be thorough and comprehensive - do not rush to finish"""
+                        "content": SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -199,7 +266,7 @@ CRITICAL RULES:
                     }
                 ],
                 temperature=0.3,
-                max_tokens=4000,  # INCREASED from default to prevent truncation
+                max_tokens=MAX_TOKENS_BY_FORMAT.get(format_type, 4000),
                 timeout=60
             )
 
@@ -209,12 +276,14 @@ CRITICAL RULES:
             # Check if response was truncated by API
             if finish_reason == "length":
                 summary_text += "\n\n[Note: Summary was truncated due to length limits. Consider using a shorter transcript or splitting into sections.]"
-                print(f"⚠️  Warning: Summary was truncated (finish_reason: length)")
+                logger.warning("⚠️  Summary was truncated (finish_reason: length)")
 
-            print(f"✅ Summary generated successfully")
-            print(f"   - Format: {format_type}")
-            print(f"   - Length: {len(summary_text)} characters")
-            print(f"   - Finish reason: {finish_reason}")
+            logger.debug(
+                "✅ Summary generated (format: %s, length: %d characters, finish reason: %s)",
+                format_type,
+                len(summary_text),
+                finish_reason
+            )
 
             return {
                 'summary_text': summary_text,
@@ -224,7 +293,7 @@ CRITICAL RULES:
             }
 
         except Exception as e:
-            print(f"❌ Summarization error: {str(e)}")
+            logger.error("❌ Summarization error: %s", e)
             return {
                 'summary_text': None,
                 'format_type': format_type,
@@ -252,16 +321,21 @@ def generate_summary_sync(
         Summary result dictionary
     """
     import asyncio
+    from concurrent.futures import ThreadPoolExecutor
 
-    service = SummarizationService()
+    async def _run() -> Dict[str, any]:
+        # The shared client's connection pool is bound to the server's event
+        # loop, so this short-lived loop gets its own client
+        async with AsyncOpenAI(api_key=settings.OPENAI_API_KEY) as client:
+            service = SummarizationService(client=client)
+            return await service.generate_summary(transcript, format_type, detected_language)
 
-    # Run async function in sync context
     try:
-        loop = asyncio.get_event_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        return asyncio.run(_run())
 
-    return loop.run_until_complete(
-        service.generate_summary(transcript, format_type, detected_language)
-    )
+    # Already inside a running loop, which can't be re-entered: run on a fresh
+    # loop in a worker thread. Async callers should await generate_summary.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _run()).result()
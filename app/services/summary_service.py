@@ -4,42 +4,66 @@ Generates AI-powered summaries using Anthropic Claude API.
 """
 from anthropic import AsyncAnthropic
 from sqlalchemy.ext.asyncio import AsyncSession
-import json
-from typing import Optional
+import asyncio
+import hashlib
+import httpx
+import logging
+import orjson
+import re
+import secrets
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from app.core.config import settings
 from app.models.summary import Summary, SummaryFormat
 
+logger = logging.getLogger(__name__)
+
+
+# SummaryService is constructed per request; the client and its connection
+# pool are shared across all of them
+_anthropic_client: Optional[AsyncAnthropic] = None
+
+
+def _get_client() -> AsyncAnthropic:
+    """
+    Return the process-wide Anthropic client, creating it on first use.
+
+    Returns:
+        Shared AsyncAnthropic client
+    """
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            # Keep idle connections for a minute (httpx defaults to 5s) so
+            # bursts of summaries reuse warm TLS connections
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0
+                )
+            )
+        )
+    return _anthropic_client
 
-class SummaryService:
-    """Service for AI summary generation using Claude."""
-
-    def __init__(self):
-        """Initialize Anthropic client."""
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
-        self.model = "claude-3-haiku-20240307"
-
-    def _get_format_specific_prompt(self, format: SummaryFormat) -> str:
-        """
-        Get format-specific system prompt for summary generation.
-
-        Args:
-            format: The desired summary format
 
-        Returns:
-            Format-specific system prompt
-        """
-        base_rules = """CRITICAL RULES:
+_BASE_RULES = """CRITICAL RULES:
 1. ONLY use information present in the transcript - do NOT hallucinate or make up details
 2. If the transcript has errors, is garbled, or unclear, explicitly state this in your summary
 3. If the transcript is in a non-English language, provide the summary in English but preserve key terms
 4. Always complete your response - NEVER stop mid-sentence or mid-paragraph
 5. Be thorough and comprehensive - capture ALL important information"""
 
-        if format == SummaryFormat.MEETING_NOTES:
-            return f"""You are an expert at analyzing meeting transcripts and creating comprehensive meeting notes.
+# Format-specific system prompts, built once at import. They are identical
+# byte for byte on every request, so repeat calls share the same prompt prefix.
+_SYSTEM_PROMPTS = {
+    SummaryFormat.MEETING_NOTES: f"""You are an expert at analyzing meeting transcripts and creating comprehensive meeting notes.
 
-{base_rules}
+{_BASE_RULES}
 
 FORMAT REQUIREMENTS - MEETING NOTES:
 Structure your response with the following sections:
@@ -56,12 +80,11 @@ Return your response as JSON with this structure:
   "key_points": ["All significant discussion points and decisions"],
   "action_items": ["Task description - Owner (if mentioned) - Deadline (if mentioned)"],
   "category": "meeting_notes"
-}}"""
+}}""",
 
-        elif format == SummaryFormat.PRODUCT_SPEC:
-            return f"""You are an expert at analyzing product discussions and creating structured product specifications.
+    SummaryFormat.PRODUCT_SPEC: f"""You are an expert at analyzing product discussions and creating structured product specifications.
 
-{base_rules}
+{_BASE_RULES}
 
 FORMAT REQUIREMENTS - PRODUCT SPECIFICATION:
 Structure your response with the following sections:
@@ -80,12 +103,11 @@ Return your response as JSON with this structure:
   "key_points": ["Critical requirements and constraints"],
   "action_items": ["Tasks needed to move forward with this product"],
   "category": "product_spec"
-}}"""
+}}""",
 
-        elif format == SummaryFormat.MOM:
-            return f"""You are an expert at creating formal Minutes of Meeting (MOM) documents.
+    SummaryFormat.MOM: f"""You are an expert at creating formal Minutes of Meeting (MOM) documents.
 
-{base_rules}
+{_BASE_RULES}
 
 FORMAT REQUIREMENTS - MINUTES OF MEETING (MOM):
 Create a formal, professional MOM with:
@@ -108,12 +130,11 @@ Return your response as JSON with this structure:
   "key_points": ["Key decisions and resolutions"],
   "action_items": ["Action item with assignee and deadline"],
   "category": "mom"
-}}"""
+}}""",
 
-        else:  # QUICK_SUMMARY (default)
-            return f"""You are an expert at creating concise, high-impact summaries of transcriptions.
+    SummaryFormat.QUICK_SUMMARY: f"""You are an expert at creating concise, high-impact summaries of transcriptions.
 
-{base_rules}
+{_BASE_RULES}
 
 FORMAT REQUIREMENTS - QUICK SUMMARY:
 Create a brief, focused summary that:
@@ -130,7 +151,490 @@ Return your response as JSON with this structure:
   "key_points": ["Top 5-7 most important points only"],
   "action_items": ["Critical action items only"],
   "category": "quick_summary"
-}}"""
+}}""",
+}
+
+
+# Filler sounds (um, uh, erm, hmm, mhm) and runs of horizontal whitespace
+# carry no content but still cost input tokens. Filler words that can carry
+# meaning ("like", "you know") are left alone. Only the lowercase spellings
+# are matched, and "er" only before a comma, so words like "ER", "err" and
+# "UM" survive. "um", "uh" and "er" are real words in other languages
+# (German "um"/"er", Portuguese "um"), so they are only stripped from
+# English transcripts.
+_DISFLUENCY_RE = re.compile(r"\b(?:um+|uh+|erm|er(?=,)|hm+|mhm)\b,?[ \t]*")
+_NON_ENGLISH_DISFLUENCY_RE = re.compile(r"\b(?:hm+|mhm)\b,?[ \t]*")
+_HORIZONTAL_SPACE_RE = re.compile(r"[ \t]+")
+
+
+def _is_english(language: Optional[str]) -> bool:
+    """Whether a transcription language (ISO code or Whisper's language name) is English."""
+    if not language:
+        return False
+    language = language.lower()
+    return language in ("en", "english") or language.startswith("en-")
+
+
+def _prepare_transcription(text: str, language: Optional[str] = None) -> str:
+    """
+    Strip filler sounds and redundant whitespace from a transcript.
+
+    Args:
+        text: Transcription text
+        language: Transcription language; English-only fillers are kept
+                  unless this is English
+
+    Returns:
+        Transcript with the same wording, minus disfluencies
+    """
+    disfluency_re = _DISFLUENCY_RE if _is_english(language) else _NON_ENGLISH_DISFLUENCY_RE
+    text = disfluency_re.sub("", text)
+    text = _HORIZONTAL_SPACE_RE.sub(" ", text)
+    return "\n".join(line.strip() for line in text.splitlines()).strip()
+
+
+# Transcripts with fewer non-whitespace characters than this (typically a
+# failed transcription) get a placeholder summary without calling Claude
+MIN_TRANSCRIPT_CHARS = 20
+TOO_SHORT_SUMMARY = "[Transcript too short to summarize]"
+
+# When SUMMARY_BATCHING_ENABLED is set, short transcripts with the same format
+# and no custom instructions that are requested within this window are
+# summarized together in one Claude call. Batches stay small so the combined
+# reply fits in the output token limit.
+SUMMARY_BATCH_WINDOW_SECONDS = 0.05
+SUMMARY_BATCH_MAX_ITEMS = 4
+SUMMARY_BATCH_MAX_TRANSCRIPT_CHARS = 3000
+
+_BATCH_INSTRUCTIONS = (
+    "Summarize each transcription below independently. Each one is headed by "
+    "its id. Return a JSON array with one object per transcription, each using "
+    "the JSON structure described above plus an \"id\" field set to the id of "
+    "the transcription it summarizes."
+)
+
+
+def _match_batch_results(results, ids: List[str]) -> Optional[List[Dict]]:
+    """
+    Map a batched reply back to its transcripts by the echoed ids.
+
+    Batches can mix requests from different users, so position alone is never
+    trusted: every id must come back exactly once.
+
+    Args:
+        results: Parsed model reply
+        ids: Ids sent with the transcripts, in input order
+
+    Returns:
+        Summary dictionaries (without the id field) in input order, or None
+        if any entry is missing, duplicated, unknown or malformed
+    """
+    if not isinstance(results, list) or len(results) != len(ids):
+        return None
+
+    by_id = {}
+    for result in results:
+        if not isinstance(result, dict):
+            return None
+        result_id = result.pop("id", None)
+        if result_id not in ids or result_id in by_id:
+            return None
+        by_id[result_id] = result
+
+    return [by_id[result_id] for result_id in ids]
+
+
+def _extract_json(text: str) -> str:
+    """
+    Return the JSON payload of a model response, unwrapping a markdown code fence.
+
+    Prefers a ```json fence, then any ``` fence; an unterminated fence runs to
+    the end of the text. Text without a fence is returned unchanged.
+
+    Args:
+        text: Raw model response
+
+    Returns:
+        JSON string to parse
+    """
+    start = text.find("```json")
+    if start >= 0:
+        start += len("```json")
+    else:
+        start = text.find("```")
+        if start < 0:
+            return text
+        start += len("```")
+
+    end = text.find("```", start)
+    return (text[start:end] if end >= 0 else text[start:]).strip()
+
+
+class _JsonObjectTracker:
+    """
+    Incrementally track the first top-level JSON object in streamed text.
+
+    Fed chunk by chunk, it reports where the object starts and ends so the
+    caller can parse it as soon as its closing brace arrives. Braces inside
+    JSON strings (including escaped quotes) are ignored.
+    """
+
+    def __init__(self):
+        self.start = -1
+        self.end = -1
+        self._offset = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk of text.
+
+        Args:
+            chunk: Next piece of the streamed response
+
+        Returns:
+            True once the top-level object is complete
+        """
+        if self.end >= 0:
+            return True
+
+        for i, char in enumerate(chunk):
+            if self.start < 0:
+                if char == "{":
+                    self.start = self._offset + i
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = self._offset + i + 1
+                    return True
+
+        self._offset += len(chunk)
+        return False
+
+
+class _SummaryBatcher:
+    """
+    Coalesce concurrent summary requests into batched Claude calls.
+
+    Requests are grouped per format; a group is sent when the batching window
+    closes or it reaches SUMMARY_BATCH_MAX_ITEMS, and each caller receives
+    its own parsed result.
+    """
+
+    def __init__(self):
+        self._pending: Dict[SummaryFormat, List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[SummaryFormat, asyncio.Task] = {}
+        self._running = set()
+
+    async def submit(self, service: "SummaryService", transcription_text: str, format: SummaryFormat) -> Dict:
+        """
+        Queue a transcript for the next batch of its format.
+
+        Args:
+            service: Service used to make the Claude call
+            transcription_text: Full transcription text
+            format: Summary format
+
+        Returns:
+            Parsed summary dictionary for this transcript
+        """
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(format, [])
+        batch.append((transcription_text, future))
+
+        if len(batch) >= SUMMARY_BATCH_MAX_ITEMS:
+            task = asyncio.create_task(self._send(service, format, self._take(format)))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        elif format not in self._timers:
+            self._timers[format] = asyncio.create_task(self._send_after_window(service, format))
+
+        return await future
+
+    def _take(self, format: SummaryFormat) -> List[Tuple[str, asyncio.Future]]:
+        """Remove and return the pending batch for a format, stopping its timer."""
+        timer = self._timers.pop(format, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        return self._pending.pop(format, [])
+
+    async def _send_after_window(self, service: "SummaryService", format: SummaryFormat) -> None:
+        """Wait for the batching window to close, then send the batch."""
+        await asyncio.sleep(SUMMARY_BATCH_WINDOW_SECONDS)
+        await self._send(service, format, self._take(format))
+
+    async def _send(
+        self,
+        service: "SummaryService",
+        format: SummaryFormat,
+        batch: List[Tuple[str, asyncio.Future]]
+    ) -> None:
+        """Summarize a batch and resolve each caller's future."""
+        if not batch:
+            return
+
+        try:
+            texts = [text for text, _ in batch]
+            if len(texts) == 1:
+                results = [await service._generate_json_single(texts[0], format)]
+            else:
+                results = await service._generate_json_batch(texts, format)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+_summary_batcher = _SummaryBatcher()
+
+
+class SummaryService:
+    """Service for AI summary generation using Claude."""
+
+    # Output token ceiling per format. Quick summaries are a few paragraphs,
+    # so they don't need the full budget of the detailed formats. Requests
+    # with custom instructions always get MAX_TOKENS.
+    MAX_TOKENS = 4096
+    MAX_TOKENS_BY_FORMAT = {
+        SummaryFormat.QUICK_SUMMARY: 1536,
+        SummaryFormat.MEETING_NOTES: 4096,
+        SummaryFormat.PRODUCT_SPEC: 4096,
+        SummaryFormat.MOM: 4096,
+    }
+
+    # Parsed results for recently summarized transcripts, keyed by a hash of
+    # the model, format, custom prompt and transcript text. Re-opened
+    # recordings and client retries are answered without another Claude call.
+    RESULT_CACHE_SIZE = 256
+    RESULT_CACHE_TTL_SECONDS = 24 * 60 * 60
+    _result_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+
+    def __init__(self):
+        """Initialize Anthropic client."""
+        self.client = _get_client()
+        self.model = "claude-3-haiku-20240307"
+
+    def _get_format_specific_prompt(self, format: SummaryFormat) -> str:
+        """
+        Get format-specific system prompt for summary generation.
+
+        Args:
+            format: The desired summary format
+
+        Returns:
+            Format-specific system prompt
+        """
+        return _SYSTEM_PROMPTS.get(format, _SYSTEM_PROMPTS[SummaryFormat.QUICK_SUMMARY])
+
+    def _cache_key(self, transcription_text: str, format: SummaryFormat, custom_prompt: Optional[str]) -> str:
+        """Build the result cache key for a summary request."""
+        digest = hashlib.sha256(
+            "\0".join((format.value, custom_prompt or "", transcription_text)).encode()
+        ).hexdigest()
+        return f"{self.model}:{digest}"
+
+    async def _generate_json(
+        self,
+        transcription_text: str,
+        format: SummaryFormat,
+        custom_prompt: Optional[str] = None,
+        use_cache: bool = True,
+        language: Optional[str] = None
+    ) -> Dict:
+        """
+        Summarize a transcript, batching short requests with concurrent ones.
+
+        Args:
+            transcription_text: Full transcription text
+            format: Summary format
+            custom_prompt: Optional custom instructions
+            use_cache: Return a cached result for identical input if available.
+                The fresh result is cached either way.
+            language: Transcription language, used for filler removal
+
+        Returns:
+            Dictionary with summary, key_points, action_items and category
+        """
+        transcription_text = _prepare_transcription(transcription_text, language)
+
+        if len("".join(transcription_text.split())) < MIN_TRANSCRIPT_CHARS:
+            return {
+                "summary": TOO_SHORT_SUMMARY,
+                "key_points": [],
+                "action_items": [],
+                "category": "poor_quality"
+            }
+
+        cache_key = self._cache_key(transcription_text, format, custom_prompt)
+
+        if use_cache:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._result_cache.move_to_end(cache_key)
+                return cached[1]
+
+        if (
+            custom_prompt
+            or not settings.SUMMARY_BATCHING_ENABLED
+            or len(transcription_text) > SUMMARY_BATCH_MAX_TRANSCRIPT_CHARS
+        ):
+            result = await self._generate_json_single(transcription_text, format, custom_prompt)
+        else:
+            result = await _summary_batcher.submit(self, transcription_text, format)
+
+        self._result_cache[cache_key] = (time.monotonic() + self.RESULT_CACHE_TTL_SECONDS, result)
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+        return result
+
+    async def _generate_json_batch(self, transcription_texts: List[str], format: SummaryFormat) -> List[Dict]:
+        """
+        Summarize several transcripts with one Claude call.
+
+        Each transcript is sent with a random id that the model must echo, and
+        results are matched by id. Falls back to one call per transcript if
+        any id is missing, repeated or unknown.
+
+        Args:
+            transcription_texts: Transcription texts, all with the same format
+            format: Summary format
+
+        Returns:
+            Parsed summary dictionaries, in input order
+        """
+        system_prompt = self._get_format_specific_prompt(format)
+
+        # Unguessable per-batch ids, so a reply can't be matched by accident
+        ids = [f"{number}-{secrets.token_hex(4)}" for number in range(1, len(transcription_texts) + 1)]
+
+        parts = [_BATCH_INSTRUCTIONS]
+        for transcription_id, transcription_text in zip(ids, transcription_texts):
+            parts.extend((f"\n\n=== TRANSCRIPTION {transcription_id} ===\n\n", transcription_text))
+        user_prompt = "".join(parts)
+
+        message = await self.client.messages.create(
+            model=self.model,
+            max_tokens=min(
+                self.MAX_TOKENS,
+                self.MAX_TOKENS_BY_FORMAT.get(format, self.MAX_TOKENS) * len(transcription_texts)
+            ),
+            temperature=0.3,
+            system=system_prompt,
+            messages=[
+                {"role": "user", "content": user_prompt}
+            ]
+        )
+
+        try:
+            results = orjson.loads(_extract_json(message.content[0].text))
+        except orjson.JSONDecodeError:
+            results = None
+
+        matched = _match_batch_results(results, ids)
+        if matched is not None:
+            return matched
+
+        logger.warning("⚠️  Batched summary reply didn't match its transcripts, summarizing individually")
+        return list(await asyncio.gather(*[
+            self._generate_json_single(transcription_text, format)
+            for transcription_text in transcription_texts
+        ]))
+
+    async def _generate_json_single(
+        self,
+        transcription_text: str,
+        format: SummaryFormat,
+        custom_prompt: Optional[str] = None
+    ) -> Dict:
+        """
+        Call Claude for a summary and parse its JSON reply.
+
+        Args:
+            transcription_text: Full transcription text
+            format: Summary format
+            custom_prompt: Optional custom instructions
+
+        Returns:
+            Dictionary with summary, key_points, action_items and category
+        """
+        # Get format-specific system prompt
+        system_prompt = self._get_format_specific_prompt(format)
+
+        # Join once so a large transcript is copied a single time
+        parts = ["Transcription:\n\n", transcription_text]
+        if custom_prompt:
+            parts.extend(("\n\nAdditional instructions: ", custom_prompt))
+        user_prompt = "".join(parts)
+
+        if custom_prompt:
+            max_tokens = self.MAX_TOKENS
+        else:
+            max_tokens = self.MAX_TOKENS_BY_FORMAT.get(format, self.MAX_TOKENS)
+
+        # Stream the reply from Claude and stop reading as soon as the JSON object is complete,
+        # rather than waiting on the closing code fence and end of message
+        chunks = []
+        tracker = _JsonObjectTracker()
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=0.3,
+            system=system_prompt,
+            messages=[
+                {"role": "user", "content": user_prompt}
+            ]
+        ) as stream:
+            async for text in stream.text_stream:
+                chunks.append(text)
+                if tracker is not None and tracker.feed(text):
+                    try:
+                        return orjson.loads("".join(chunks)[tracker.start:tracker.end])
+                    except orjson.JSONDecodeError:
+                        # Not a clean JSON object - read the rest and fall
+                        # back to parsing the full response
+                        tracker = None
+
+        # Parse response
+        response_text = "".join(chunks)
+
+        # Try to extract JSON from response
+        try:
+            # Sometimes Claude wraps JSON in markdown code blocks
+            json_str = _extract_json(response_text)
+
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # Fallback if JSON parsing fails - DO NOT TRUNCATE
+            logger.warning("⚠️  Failed to parse JSON response, using full text as summary")
+            return {
+                "summary": response_text,  # Full text, not truncated
+                "key_points": [],
+                "action_items": [],
+                "category": "unknown"
+            }
 
     async def generate_summary(
         self,
@@ -139,7 +643,8 @@ Return your response as JSON with this structure:
         transcription_id: str,
         db: AsyncSession,
         format: SummaryFormat = SummaryFormat.QUICK_SUMMARY,
-        custom_prompt: Optional[str] = None
+        custom_prompt: Optional[str] = None,
+        language: Optional[str] = None
     ) -> Summary:
         """
         Generate AI summary from transcription text.
@@ -148,9 +653,10 @@ Return your response as JSON with this structure:
             transcription_text: Full transcription text
             recording_id: Recording ID
             transcription_id: Transcription ID
-            db: Database session
+            db: Database session (the summary is flushed; the caller commits)
             format: Summary format (MEETING_NOTES, PRODUCT_SPEC, MOM, QUICK_SUMMARY)
             custom_prompt: Optional custom instructions
+            language: Transcription language (English fillers are only stripped from English)
 
         Returns:
             Summary model instance
@@ -159,49 +665,10 @@ Return your response as JSON with this structure:
             Exception: If summary generation fails
         """
         try:
-            # Get format-specific system prompt
-            system_prompt = self._get_format_specific_prompt(format)
-
-            user_prompt = f"Transcription:\n\n{transcription_text}"
-
-            if custom_prompt:
-                user_prompt += f"\n\nAdditional instructions: {custom_prompt}"
-
-            # Call Claude API with higher token limit for comprehensive summaries
-            message = await self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,  # Increased to allow comprehensive summaries
-                temperature=0.3,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ]
+            result = await self._generate_json(
+                transcription_text, format, custom_prompt, language=language
             )
 
-            # Parse response
-            response_text = message.content[0].text
-
-            # Try to extract JSON from response
-            try:
-                # Sometimes Claude wraps JSON in markdown code blocks
-                if "```json" in response_text:
-                    json_str = response_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in response_text:
-                    json_str = response_text.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response_text
-
-                result = json.loads(json_str)
-            except json.JSONDecodeError:
-                # Fallback if JSON parsing fails - DO NOT TRUNCATE
-                print(f"⚠️  Warning: Failed to parse JSON response, using full text as summary")
-                result = {
-                    "summary": response_text,  # Full text, not truncated
-                    "key_points": [],
-                    "action_items": [],
-                    "category": "unknown"
-                }
-
             # Create summary record
             summary = Summary(
                 recording_id=recording_id,
@@ -215,12 +682,13 @@ Return your response as JSON with this structure:
             )
 
             db.add(summary)
-            await db.commit()
+            # Flush only; the request's session dependency (get_db) commits
+            await db.flush()
 
             return summary
 
         except Exception as e:
-            print(f"Summary generation error: {str(e)}")
+            logger.exception("Summary generation failed for recording %s", recording_id)
             raise Exception(f"Failed to generate summary: {str(e)}")
 
     async def regenerate_summary(
@@ -229,7 +697,8 @@ Return your response as JSON with this structure:
         transcription_text: str,
         db: AsyncSession,
         format: Optional[SummaryFormat] = None,
-        custom_prompt: Optional[str] = None
+        custom_prompt: Optional[str] = None,
+        language: Optional[str] = None
     ) -> Summary:
         """
         Regenerate an existing summary.
@@ -237,9 +706,10 @@ Return your response as JSON with this structure:
         Args:
             summary: Existing summary to update
             transcription_text: Transcription text
-            db: Database session
+            db: Database session (the update is flushed; the caller commits)
             format: Optional new format (uses existing format if not provided)
             custom_prompt: Optional custom instructions
+            language: Transcription language (English fillers are only stripped from English)
 
         Returns:
             Updated summary
@@ -251,47 +721,11 @@ Return your response as JSON with this structure:
             # Use provided format or keep existing format
             summary_format = format if format is not None else summary.format
 
-            # Get format-specific system prompt
-            system_prompt = self._get_format_specific_prompt(summary_format)
-
-            user_prompt = f"Transcription:\n\n{transcription_text}"
-
-            if custom_prompt:
-                user_prompt += f"\n\nAdditional instructions: {custom_prompt}"
-
-            # Call Claude API with higher token limit for comprehensive summaries
-            message = await self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,  # Increased to allow comprehensive summaries
-                temperature=0.3,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ]
+            # The user asked for a new summary, so don't hand back a cached one
+            result = await self._generate_json(
+                transcription_text, summary_format, custom_prompt, use_cache=False, language=language
             )
 
-            # Parse response
-            response_text = message.content[0].text
-
-            try:
-                if "```json" in response_text:
-                    json_str = response_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in response_text:
-                    json_str = response_text.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response_text
-
-                result = json.loads(json_str)
-            except json.JSONDecodeError:
-                # Fallback if JSON parsing fails - DO NOT TRUNCATE
-                print(f"⚠️  Warning: Failed to parse JSON response in regenerate, using full text")
-                result = {
-                    "summary": response_text,  # Full text, not truncated
-                    "key_points": [],
-                    "action_items": [],
-                    "category": "unknown"
-                }
-
             # Update existing summary
             summary.summary_text = result.get("summary", "")
             summary.key_points = result.get("key_points", [])
@@ -300,10 +734,11 @@ Return your response as JSON with this structure:
             summary.format = summary_format
             summary.model_used = self.model
 
-            await db.commit()
+            # Flush only; the request's session dependency (get_db) commits
+            await db.flush()
 
             return summary
 
         except Exception as e:
-            print(f"Summary regeneration error: {str(e)}")
+            logger.exception("Summary regeneration failed for recording %s", summary.recording_id)
             raise Exception(f"Failed to regenerate summary: {str(e)}")
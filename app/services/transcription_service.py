@@ -2,17 +2,39 @@
 Production-ready transcription service with adaptive audio processing pipeline.
 Handles everything from audio preprocessing to final transcript.
 """
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from functools import cached_property
+import asyncio
 import os
+import logging
+import orjson
 from typing import Dict, Optional
 
 from app.core.config import settings
 from app.models.transcription import Transcription
-from app.services.audio_processor import AudioProcessor
-from app.services.whisper_transcriber import WhisperTranscriber
-from app.services.audio_enhancer import AudioEnhancer
+from app.services.whisper_transcriber import WhisperTranscriber, get_openai_client
 from app.services.production_whisper_service import ProductionWhisperService, TranscriptionQuality
 
+logger = logging.getLogger(__name__)
+
+
+def _remove_if_exists(path: str) -> bool:
+    """
+    Delete a file if it is there.
+
+    Args:
+        path: File to delete
+
+    Returns:
+        True if the file was deleted, False if it didn't exist
+    """
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+
 
 class TranscriptionService:
     """
@@ -22,19 +44,39 @@ class TranscriptionService:
 
     def __init__(self, use_production_service: bool = True):
         """
-        Initialize transcription service with processor, transcriber, and enhancer.
+        Initialize transcription service.
+
+        The processor, transcriber and enhancer used by the adaptive pipeline
+        are created on first use, so the production path never builds them.
 
         Args:
             use_production_service: If True, uses ProductionWhisperService with multi-temperature retry.
                                    If False, uses the previous adaptive service.
         """
         self.use_production_service = use_production_service
-        self.processor = AudioProcessor()
-        self.transcriber = WhisperTranscriber(settings.OPENAI_API_KEY)
-        self.enhancer = AudioEnhancer()
 
         if use_production_service:
-            self.production_service = ProductionWhisperService(settings.OPENAI_API_KEY)
+            self.production_service = ProductionWhisperService(
+                settings.OPENAI_API_KEY,
+                speculative_retries=settings.WHISPER_SPECULATIVE_RETRIES
+            )
+
+    @cached_property
+    def processor(self):
+        """Audio analyzer and basic preprocessor (pydub-based)."""
+        from app.services.audio_processor import AudioProcessor
+        return AudioProcessor()
+
+    @cached_property
+    def transcriber(self) -> WhisperTranscriber:
+        """Adaptive Whisper transcriber."""
+        return WhisperTranscriber(settings.OPENAI_API_KEY)
+
+    @cached_property
+    def enhancer(self):
+        """ffmpeg-based audio enhancer."""
+        from app.services.audio_enhancer import AudioEnhancer
+        return AudioEnhancer()
 
     async def transcribe_audio(
         self,
@@ -60,15 +102,18 @@ class TranscriptionService:
         """
         from sqlalchemy import select
 
-        # Check if transcription already exists for this recording
-        result = await db.execute(
-            select(Transcription).filter(Transcription.recording_id == recording_id)
-        )
-        existing = result.scalar_one_or_none()
+        # Check if transcription already exists for this recording. Callers
+        # normally checked already, so probe the unique index for the id only
+        # and load the full row (with its text) just on the rare hit.
+        existing_id = (await db.execute(
+            select(Transcription.id)
+            .where(Transcription.recording_id == recording_id)
+            .limit(1)
+        )).scalar_one_or_none()
 
-        if existing:
-            print(f"ℹ️  Transcription already exists for recording {recording_id}, returning existing")
-            return existing
+        if existing_id is not None:
+            logger.info("ℹ️  Transcription already exists for recording %s, returning existing", recording_id)
+            return await db.get(Transcription, existing_id)
 
         # If production service is enabled, use it instead
         if self.use_production_service:
@@ -78,15 +123,18 @@ class TranscriptionService:
         temp_processed = None
 
         try:
-            # Step 1: Analyze input audio
-            print("🔍 Analyzing audio...")
-            audio_metadata = self.processor.analyze_audio(audio_file_path)
+            # Step 1: Read the audio's duration and format from its header.
+            # Loudness comes from the enhancement pass below, which decodes
+            # the audio anyway, so it isn't decoded twice.
+            audio_metadata = self.processor.probe_audio(audio_file_path)
 
             # Log audio characteristics
-            print(f"   - Duration: {audio_metadata['duration_seconds']:.2f}s")
-            print(f"   - Sample rate: {audio_metadata['sample_rate']}Hz")
-            print(f"   - Channels: {audio_metadata['channels']}")
-            print(f"   - Volume (dBFS): {audio_metadata['dBFS']:.2f}dB")
+            logger.info(
+                "🔍 Audio: %.2fs, %sHz, %s channel(s)",
+                audio_metadata['duration_seconds'],
+                audio_metadata['sample_rate'],
+                audio_metadata['channels']
+            )
 
             # Validate duration
             if audio_metadata['duration_seconds'] < 1:
@@ -96,66 +144,77 @@ class TranscriptionService:
                 raise ValueError("Audio too long (> 2 hours). Please split into smaller files.")
 
             # Step 2: Enhanced audio preprocessing pipeline
-            print("⚙️  Preprocessing audio...")
             temp_processed = f"{os.path.splitext(audio_file_path)[0]}_processed.mp3"
 
             # Try enhanced preprocessing with noise reduction
             try:
-                print("🎛️  Applying audio enhancement (noise reduction, normalization)...")
+                logger.debug("🎛️  Applying audio enhancement (noise reduction, normalization)...")
                 enhancement_result = await self.enhancer.enhance_for_whisper_async(
                     audio_file_path,
                     temp_processed
                 )
 
                 if enhancement_result['success']:
-                    print(f"   ✅ Enhancement successful")
-                    print(f"   - Original volume: {enhancement_result['original_dBFS']:.2f}dB")
+                    logger.info(
+                        "✅ Enhancement successful (original volume: %.2fdB)",
+                        enhancement_result['original_dbfs']
+                    )
                 else:
                     # Fall back to basic preprocessing if enhancement fails
-                    print(f"   ⚠️  Enhancement failed, using basic preprocessing...")
+                    logger.warning("⚠️  Enhancement failed, using basic preprocessing...")
                     preprocessing_result = await self.processor.preprocess_audio_async(
                         audio_file_path,
                         temp_processed
                     )
                     if not preprocessing_result['success']:
                         raise Exception(f"Audio preprocessing failed: {preprocessing_result.get('error')}")
-                    print(f"   - Normalized: {preprocessing_result['normalized']}")
-                    print(f"   - Original volume: {preprocessing_result['original_dBFS']:.2f}dB")
+                    logger.info(
+                        "Preprocessed (normalized: %s, original volume: %.2fdB)",
+                        preprocessing_result['normalized'],
+                        preprocessing_result['original_dBFS']
+                    )
 
             except Exception as e:
                 # Fall back to basic preprocessing
-                print(f"   ⚠️  Enhancement error: {str(e)}, falling back to basic preprocessing...")
+                logger.warning("⚠️  Enhancement error: %s, falling back to basic preprocessing...", e)
                 preprocessing_result = await self.processor.preprocess_audio_async(
                     audio_file_path,
                     temp_processed
                 )
                 if not preprocessing_result['success']:
                     raise Exception(f"Audio preprocessing failed: {preprocessing_result.get('error')}")
-                print(f"   - Normalized: {preprocessing_result['normalized']}")
-                print(f"   - Original volume: {preprocessing_result['original_dBFS']:.2f}dB")
+                logger.info(
+                    "Preprocessed (normalized: %s, original volume: %.2fdB)",
+                    preprocessing_result['normalized'],
+                    preprocessing_result['original_dBFS']
+                )
 
             # Step 3: Transcribe with Whisper using adaptive configuration
-            print("🎙️  Transcribing with Whisper...")
+            logger.debug("🎙️  Transcribing with Whisper...")
             transcription_result = await self.transcriber.transcribe(
                 temp_processed,
                 audio_metadata
             )
 
-            # Step 4: Log results
-            print(f"✅ Transcription completed:")
-            print(f"   - Language: {transcription_result['language']}")
-            print(f"   - Confidence: {transcription_result['confidence']:.2f}")
-            print(f"   - Attempts: {transcription_result['attempts']}")
-            print(f"   - Temperature used: {transcription_result['temperature_used']}")
-            print(f"   - Text length: {len(transcription_result['text'])} chars")
-            print(f"   - Preview: {transcription_result['text'][:100]}...")
+            # Step 4: Log results as one machine-parseable line
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ Transcription completed %s", orjson.dumps({
+                    'recording_id': recording_id,
+                    'language': transcription_result['language'],
+                    'confidence': transcription_result['confidence'],
+                    'attempts': transcription_result['attempts'],
+                    'temperature': transcription_result['temperature_used'],
+                    'length': len(transcription_result['text']),
+                    'preview': transcription_result['text'][:100]
+                }).decode())
 
             # Step 5: Warn if low confidence
             if transcription_result['confidence'] < 0.3:
-                print(f"⚠️  WARNING: Low confidence transcription ({transcription_result['confidence']:.2f})")
+                logger.warning("⚠️  Low confidence transcription (%.2f)", transcription_result['confidence'])
 
             # Step 6: Create transcription record
-            transcription = Transcription(
+            return await self._save_transcription(
+                db,
                 recording_id=recording_id,
                 text=transcription_result['text'],
                 language=transcription_result['language'],
@@ -163,40 +222,19 @@ class TranscriptionService:
                 provider="whisper"
             )
 
-            db.add(transcription)
-
-            try:
-                await db.commit()
-                await db.refresh(transcription)
-                return transcription
-            except Exception as db_error:
-                # Handle duplicate key error gracefully
-                if "duplicate key" in str(db_error).lower() or "unique constraint" in str(db_error).lower():
-                    print(f"⚠️  Duplicate detected during commit, fetching existing transcription")
-                    await db.rollback()
-                    # Fetch and return the existing transcription
-                    result_check = await db.execute(
-                        select(Transcription).filter(Transcription.recording_id == recording_id)
-                    )
-                    existing = result_check.scalar_one_or_none()
-                    if existing:
-                        print(f"✅ Returning existing transcription")
-                        return existing
-                # Re-raise if it's a different error
-                raise
-
         except Exception as e:
-            print(f"❌ Transcription error: {str(e)}")
+            logger.error("❌ Transcription error: %s", e)
             raise Exception(f"Failed to transcribe audio: {str(e)}")
 
         finally:
             # Cleanup temporary files
-            if cleanup and temp_processed and os.path.exists(temp_processed):
+            # (off the event loop, since deletes can block on slow disks)
+            if cleanup and temp_processed:
                 try:
-                    os.remove(temp_processed)
-                    print(f"🗑️  Cleaned up temporary file: {temp_processed}")
+                    if await asyncio.to_thread(_remove_if_exists, temp_processed):
+                        logger.debug("🗑️  Cleaned up temporary file: %s", temp_processed)
                 except Exception as e:
-                    print(f"⚠️  Failed to cleanup temp file: {e}")
+                    logger.warning("⚠️  Failed to cleanup temp file: %s", e)
 
     async def transcribe_audio_production(
         self,
@@ -224,80 +262,109 @@ class TranscriptionService:
         from sqlalchemy import select
 
         try:
-            # Check if transcription already exists for this recording
-            result = await db.execute(
-                select(Transcription).filter(Transcription.recording_id == recording_id)
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                print(f"ℹ️  Transcription already exists for recording {recording_id}, returning existing")
-                return existing
-
-            print(f"\n{'='*60}")
-            print(f"PRODUCTION TRANSCRIPTION SERVICE")
-            print(f"{'='*60}")
+            # Byte-identical audio (e.g. the same file re-uploaded as a new
+            # recording) reuses the stored transcript instead of calling Whisper
+            audio_hash = await ProductionWhisperService.hash_file(audio_file_path)
+            duplicate = (await db.execute(
+                select(Transcription)
+                .filter(Transcription.audio_sha256 == audio_hash)
+                .limit(1)
+            )).scalar_one_or_none()
+            if duplicate is not None:
+                logger.info("♻️  Identical audio already transcribed for recording %s, reusing it", duplicate.recording_id)
+                return await self._save_transcription(
+                    db,
+                    recording_id=recording_id,
+                    text=duplicate.text,
+                    language=duplicate.language,
+                    confidence=duplicate.confidence,
+                    provider=duplicate.provider,
+                    audio_sha256=audio_hash
+                )
 
             # Use production service with multi-temperature retry
             result = await self.production_service.transcribe(
                 audio_path=audio_file_path,
                 language=None,  # Auto-detect
-                max_retries=5
+                max_retries=5,
+                audio_hash=audio_hash
             )
 
             if not result.success:
                 raise Exception(f"Transcription failed: {result.error}")
 
-            # Log quality metrics
-            print(f"\n📊 Quality Metrics:")
-            print(f"   - Quality Level: {result.quality.value}")
-            print(f"   - Confidence Score: {result.confidence_score:.2f}")
-            print(f"   - Processing Time: {result.processing_time_seconds:.1f}s")
-            print(f"   - Temperature Used: {result.temperature_used}")
-            print(f"   - Attempts: {result.attempts}")
-
-            if result.warnings:
-                print(f"\n⚠️  Warnings:")
-                for warning in result.warnings:
-                    print(f"   - {warning}")
+            # Log quality metrics as one machine-parseable line
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📊 Transcription completed %s", orjson.dumps({
+                    'recording_id': recording_id,
+                    'quality': result.quality.value,
+                    'language': result.language,
+                    'confidence': result.confidence_score,
+                    'processing_time': result.processing_time_seconds,
+                    'temperature': result.temperature_used,
+                    'attempts': result.attempts,
+                    'warnings': result.warnings,
+                    'preview': result.transcript[:100]
+                }).decode())
 
             # Create transcription record
-            transcription = Transcription(
+            transcription = await self._save_transcription(
+                db,
                 recording_id=recording_id,
                 text=result.transcript,
                 language=result.language,
                 confidence=result.confidence_score,
-                provider="whisper-production"
+                provider="whisper-production",
+                audio_sha256=audio_hash
             )
-
-            db.add(transcription)
-
-            try:
-                await db.commit()
-                await db.refresh(transcription)
-                print(f"\n✅ Transcription saved to database")
-                print(f"{'='*60}\n")
-                return transcription
-            except Exception as db_error:
-                # Handle duplicate key error gracefully
-                if "duplicate key" in str(db_error).lower() or "unique constraint" in str(db_error).lower():
-                    print(f"⚠️  Duplicate detected during commit, fetching existing transcription")
-                    await db.rollback()
-                    # Fetch and return the existing transcription
-                    result_check = await db.execute(
-                        select(Transcription).filter(Transcription.recording_id == recording_id)
-                    )
-                    existing = result_check.scalar_one_or_none()
-                    if existing:
-                        print(f"✅ Returning existing transcription")
-                        return existing
-                # Re-raise if it's a different error
-                raise
+            logger.info("✅ Transcription saved to database")
+            return transcription
 
         except Exception as e:
-            print(f"❌ Production transcription error: {str(e)}")
+            logger.error("❌ Production transcription error: %s", e)
             raise Exception(f"Failed to transcribe audio: {str(e)}")
 
+    async def _save_transcription(
+        self,
+        db: AsyncSession,
+        recording_id: str,
+        **fields
+    ) -> Transcription:
+        """
+        Insert a transcription, or return the existing one for this recording.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING RETURNING, so a concurrent
+        request that saved first costs one extra SELECT instead of a failed
+        commit, a rollback and a re-query.
+
+        Args:
+            db: Database session
+            recording_id: Recording ID (unique per transcription)
+            **fields: Remaining Transcription column values
+
+        Returns:
+            The inserted or already existing Transcription
+        """
+        from sqlalchemy import select
+
+        result = await db.execute(
+            insert(Transcription)
+            .values(recording_id=recording_id, **fields)
+            .on_conflict_do_nothing(index_elements=[Transcription.recording_id])
+            .returning(Transcription)
+        )
+        transcription = result.scalar_one_or_none()
+
+        if transcription is None:
+            logger.warning("⚠️  Transcription already saved for recording %s, returning existing", recording_id)
+            result = await db.execute(
+                select(Transcription).filter(Transcription.recording_id == recording_id)
+            )
+            transcription = result.scalar_one()
+
+        await db.commit()
+        return transcription
+
     async def transcribe_with_timestamps(
         self,
         audio_file_path: str,
@@ -318,7 +385,7 @@ class TranscriptionService:
         """
         try:
             # Preprocess audio first for better results
-            print("🔍 Analyzing and preprocessing audio for timestamp transcription...")
+            logger.debug("🔍 Analyzing and preprocessing audio for timestamp transcription...")
             audio_metadata = self.processor.analyze_audio(audio_file_path)
 
             temp_processed = f"{os.path.splitext(audio_file_path)[0]}_processed_timestamps.mp3"
@@ -330,31 +397,22 @@ class TranscriptionService:
             if not preprocessing_result['success']:
                 raise Exception(f"Audio preprocessing failed: {preprocessing_result.get('error')}")
 
-            # Use processed audio for transcription
-            from openai import AsyncOpenAI
-            import aiofiles
-            from io import BytesIO
-
-            client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
-            async with aiofiles.open(temp_processed, 'rb') as audio_file:
-                audio_data = await audio_file.read()
-
-            audio_buffer = BytesIO(audio_data)
-            audio_buffer.name = temp_processed
-
-            # Get detailed response with timestamps
-            transcript_response = await client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_buffer,
-                language=language,
-                response_format="verbose_json",
-                timestamp_granularities=["word"]
-            )
+            # Use processed audio for transcription, over the shared client
+            client = get_openai_client()
+
+            # Get detailed response with timestamps, streaming the file to
+            # the API instead of loading it into memory first
+            with open(temp_processed, 'rb') as audio_file:
+                transcript_response = await client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=(os.path.basename(temp_processed), audio_file),
+                    language=language,
+                    response_format="verbose_json",
+                    timestamp_granularities=["word"]
+                )
 
             # Cleanup
-            if os.path.exists(temp_processed):
-                os.remove(temp_processed)
+            await asyncio.to_thread(_remove_if_exists, temp_processed)
 
             return {
                 "text": transcript_response.text,
@@ -363,7 +421,7 @@ class TranscriptionService:
             }
 
         except Exception as e:
-            print(f"❌ Transcription with timestamps error: {str(e)}")
+            logger.error("❌ Transcription with timestamps error: %s", e)
             raise Exception(f"Failed to transcribe with timestamps: {str(e)}")
 
     async def get_transcription_stats(self, audio_file_path: str) -> Dict:
@@ -3,17 +3,65 @@ Usage tracking service for monitoring and enforcing subscription limits.
 Handles monthly usage tracking, limit enforcement, and reset logic.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, case, extract, literal_column
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import calendar
 
 from app.models.user import User, SubscriptionTier
 from app.models.recording import Recording
 
 
+def _add_month(value: datetime) -> datetime:
+    """
+    Move a datetime forward one calendar month.
+
+    The day is clamped to the end of a shorter month (Jan 31 -> Feb 28/29),
+    matching Postgres' INTERVAL '1 month' used by the bulk daily reset.
+    """
+    year, month = (value.year + 1, 1) if value.month == 12 else (value.year, value.month + 1)
+    return value.replace(year=year, month=month, day=min(value.day, calendar.monthrange(year, month)[1]))
+
+
+# Usage warning templates, keyed by (user_type, level)
+_WARNING_MESSAGES = {
+    ("trial", "exceeded"): "You've used your free 10 minutes. Subscribe for unlimited recording.",
+    ("trial", "warning"): "Trial warning: {minutes_remaining:.1f} minutes remaining of your free 10 minutes.",
+    ("paid", "exceeded"): "Monthly limit reached. Resets on {reset_date:%B %d, %Y}.",
+    ("paid", "exceeded_no_reset"): "Monthly limit reached.",
+    ("paid", "warning"): "Usage warning: {hours_used:.1f} of {hours_limit} hours used. {hours_remaining:.1f} hours remaining.",
+}
+
+
 class UsageTrackingService:
     """Service for tracking and managing user recording usage."""
 
+    @staticmethod
+    async def _get_user(user_id: str, db: AsyncSession) -> User:
+        """
+        Load a user through the session's identity map.
+
+        Routes usually authenticate with the same session, so the row is
+        already loaded and no query is issued; otherwise this is a primary
+        key SELECT.
+
+        Args:
+            user_id: User ID
+            db: Database session
+
+        Returns:
+            User model instance
+
+        Raises:
+            Exception: If user not found
+        """
+        user = await db.get(User, user_id)
+
+        if not user:
+            raise Exception(f"User {user_id} not found")
+
+        return user
+
     @staticmethod
     async def track_recording_usage(
         user_id: str,
@@ -34,24 +82,39 @@ class UsageTrackingService:
         Raises:
             Exception: If user not found
         """
-        # Get user
+        # Convert seconds to hours (paid users) and minutes (trial users)
+        duration_hours = recording_duration_seconds / 3600.0
+        duration_minutes = recording_duration_seconds / 60.0
+
+        # Increment the counter for the user's type in a single UPDATE ...
+        # RETURNING, so concurrent uploads can't lose each other's usage and
+        # there's no separate SELECT or refresh. The 'fetch' strategy also
+        # brings an already loaded User in this session up to date.
         result = await db.execute(
-            select(User).filter(User.id == user_id)
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                trial_minutes_used=case(
+                    (User.is_trial_user == True, User.trial_minutes_used + duration_minutes),
+                    else_=User.trial_minutes_used
+                ),
+                monthly_hours_used=case(
+                    (User.is_trial_user == False, User.monthly_hours_used + duration_hours),
+                    else_=User.monthly_hours_used
+                )
+            )
+            .returning(User)
+            .execution_options(synchronize_session="fetch")
         )
         user = result.scalar_one_or_none()
 
         if not user:
             raise Exception(f"User {user_id} not found")
 
-        # Convert seconds to hours
-        duration_hours = recording_duration_seconds / 3600.0
+        await db.commit()
 
-        # Update usage based on user type
+        # Report usage based on user type
         if user.is_trial_user:
-            # Trial users track in minutes
-            duration_minutes = recording_duration_seconds / 60.0
-            user.trial_minutes_used += duration_minutes
-
             return {
                 "success": True,
                 "user_type": "trial",
@@ -60,9 +123,6 @@ class UsageTrackingService:
                 "duration_tracked_minutes": duration_minutes
             }
         else:
-            # Paid users track in hours (monthly)
-            user.monthly_hours_used += duration_hours
-
             # Calculate remaining hours
             hours_limit = user.monthly_hours_limit or 0
             hours_remaining = max(0, hours_limit - user.monthly_hours_used)
@@ -70,9 +130,6 @@ class UsageTrackingService:
             # Calculate usage percentage
             usage_percentage = (user.monthly_hours_used / hours_limit * 100) if hours_limit > 0 else 0
 
-            await db.commit()
-            await db.refresh(user)
-
             return {
                 "success": True,
                 "user_type": "paid",
@@ -100,14 +157,7 @@ class UsageTrackingService:
         Returns:
             Dictionary with limit check results
         """
-        # Get user
-        result = await db.execute(
-            select(User).filter(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise Exception(f"User {user_id} not found")
+        user = await UsageTrackingService._get_user(user_id, db)
 
         # Check trial users
         if user.is_trial_user:
@@ -161,29 +211,34 @@ class UsageTrackingService:
         Returns:
             Warning message or None
         """
-        if usage_info["user_type"] == "trial":
+        user_type = usage_info["user_type"]
+
+        # Pick the warning level, then format only that template
+        if user_type == "trial":
             if usage_info["limit_exceeded"]:
-                return "You've used your free 10 minutes. Subscribe for unlimited recording."
+                level = "exceeded"
             elif usage_info["usage_percentage"] >= 80:
-                minutes_remaining = usage_info["trial_minutes_remaining"]
-                return f"Trial warning: {minutes_remaining:.1f} minutes remaining of your free 10 minutes."
-            return None
+                level = "warning"
+            else:
+                return None
+            return _WARNING_MESSAGES[(user_type, level)].format(
+                minutes_remaining=usage_info.get("trial_minutes_remaining", 0)
+            )
 
         # Paid users
         if usage_info.get("warning_100_percent"):
-            reset_date = usage_info.get("reset_date")
-            if reset_date:
-                reset_str = reset_date.strftime("%B %d, %Y")
-                return f"Monthly limit reached. Resets on {reset_str}."
-            return "Monthly limit reached."
-
+            level = "exceeded" if usage_info.get("reset_date") else "exceeded_no_reset"
         elif usage_info.get("warning_80_percent"):
-            hours_used = usage_info["monthly_hours_used"]
-            hours_limit = usage_info["monthly_hours_limit"]
-            hours_remaining = usage_info["monthly_hours_remaining"]
-            return f"Usage warning: {hours_used:.1f} of {hours_limit} hours used. {hours_remaining:.1f} hours remaining."
+            level = "warning"
+        else:
+            return None
 
-        return None
+        return _WARNING_MESSAGES[(user_type, level)].format(
+            reset_date=usage_info.get("reset_date"),
+            hours_used=usage_info.get("monthly_hours_used"),
+            hours_limit=usage_info.get("monthly_hours_limit"),
+            hours_remaining=usage_info.get("monthly_hours_remaining")
+        )
 
     @staticmethod
     async def reset_monthly_usage(
@@ -200,14 +255,7 @@ class UsageTrackingService:
         Returns:
             Dictionary with reset information
         """
-        # Get user
-        result = await db.execute(
-            select(User).filter(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise Exception(f"User {user_id} not found")
+        user = await UsageTrackingService._get_user(user_id, db)
 
         # Don't reset trial users
         if user.is_trial_user:
@@ -225,18 +273,14 @@ class UsageTrackingService:
         # Calculate next reset date (add 1 month)
         if user.usage_reset_at:
             # Add 1 month to current reset date
-            current_reset = user.usage_reset_at
-            if current_reset.month == 12:
-                next_reset = current_reset.replace(year=current_reset.year + 1, month=1)
-            else:
-                next_reset = current_reset.replace(month=current_reset.month + 1)
-            user.usage_reset_at = next_reset
+            user.usage_reset_at = _add_month(user.usage_reset_at)
         else:
             # Set next reset to 1 month from now
             user.usage_reset_at = datetime.utcnow() + timedelta(days=30)
 
+        # Sessions don't expire on commit, so the values just written are
+        # still loaded - no refresh SELECT needed
         await db.commit()
-        await db.refresh(user)
 
         return {
             "success": True,
@@ -248,6 +292,61 @@ class UsageTrackingService:
             "monthly_hours_limit": user.monthly_hours_limit
         }
 
+    @staticmethod
+    async def reset_monthly_usage_for_day(
+        day: int,
+        db: AsyncSession
+    ) -> List[Dict]:
+        """
+        Reset monthly usage for every paid user whose anniversary falls on a given day.
+
+        Runs as a single UPDATE ... RETURNING instead of one read-modify-write
+        per user. Applies the same rules as reset_monthly_usage: trial users
+        are skipped, usage drops to zero and the next reset moves forward a
+        month (or to 30 days from now if unset).
+
+        Args:
+            day: Day of month (1-31)
+            db: Database session
+
+        Returns:
+            List of dictionaries with user_id, email and old_usage_hours per reset user
+        """
+        due = (
+            select(User.id, User.monthly_hours_used.label("old_usage_hours"))
+            .where(
+                extract("day", User.subscription_anniversary_date) == day,
+                User.is_trial_user == False
+            )
+            .with_for_update()
+            .subquery()
+        )
+
+        result = await db.execute(
+            update(User)
+            .where(User.id == due.c.id)
+            .values(
+                monthly_hours_used=0.0,
+                usage_reset_at=case(
+                    (User.usage_reset_at.is_(None), datetime.utcnow() + timedelta(days=30)),
+                    else_=User.usage_reset_at + literal_column("INTERVAL '1 month'")
+                )
+            )
+            .returning(User.id, User.email, due.c.old_usage_hours)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await db.commit()
+
+        return [
+            {
+                "user_id": row.id,
+                "email": row.email,
+                "old_usage_hours": row.old_usage_hours
+            }
+            for row in rows
+        ]
+
     @staticmethod
     async def get_usage_history(
         user_id: str,
@@ -263,14 +362,7 @@ class UsageTrackingService:
         Returns:
             Dictionary with current usage stats
         """
-        # Get user
-        result = await db.execute(
-            select(User).filter(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise Exception(f"User {user_id} not found")
+        user = await UsageTrackingService._get_user(user_id, db)
 
         # Trial users
         if user.is_trial_user:
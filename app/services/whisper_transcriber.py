@@ -3,10 +3,45 @@ Production-ready Whisper transcription service.
 Auto-optimizes parameters based on audio characteristics.
 """
 from openai import AsyncOpenAI
+from bisect import bisect_left
+from collections import Counter
+import asyncio
+import httpx
+import logging
+import os
 import time
 from typing import Dict, Optional
-import aiofiles
-from io import BytesIO
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# TranscriptionService (and with it WhisperTranscriber) is constructed per
+# request; the client and its connection pool are shared across all of them
+_openai_client: Optional[AsyncOpenAI] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Return the process-wide OpenAI client for Whisper calls, creating it on first use.
+
+    Returns:
+        Shared AsyncOpenAI client
+    """
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0
+                )
+            )
+        )
+    return _openai_client
 
 
 class WhisperTranscriber:
@@ -15,6 +50,17 @@ class WhisperTranscriber:
     Auto-optimizes parameters based on audio.
     """
 
+    # Transcripts longer than this are quality-checked in a worker thread
+    OFFLOAD_QUALITY_CHECK_CHARS = 20_000
+
+    # Request parameters shared by every call; only temperature varies.
+    # DO NOT specify language - let Whisper auto-detect (works for 99+ languages).
+    # DO NOT use prompts unless we have verified context - generic prompts can hurt accuracy.
+    BASE_REQUEST_PARAMS = {
+        'model': 'whisper-1',
+        'response_format': 'verbose_json',  # Get detailed response
+    }
+
     def __init__(self, api_key: str):
         """
         Initialize Whisper transcriber.
@@ -22,7 +68,10 @@ class WhisperTranscriber:
         Args:
             api_key: OpenAI API key
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        if api_key == settings.OPENAI_API_KEY:
+            self.client = get_openai_client()
+        else:
+            self.client = AsyncOpenAI(api_key=api_key)
         self.max_retries = 3
         self.base_retry_delay = 2
 
@@ -65,20 +114,8 @@ class WhisperTranscriber:
             audio_metadata.get('duration_seconds', 0)
         )
 
-        # Build request parameters
-        params = {
-            'model': 'whisper-1',
-            'response_format': 'verbose_json',  # Get detailed response
-            'temperature': temperature,
-        }
-
-        # DO NOT specify language - let Whisper auto-detect
-        # This works for 99+ languages automatically
-
-        # DO NOT use prompts unless we have verified context
-        # Generic prompts can hurt accuracy
-
-        return params
+        # A fresh dict, since retries adjust the temperature in place
+        return {**self.BASE_REQUEST_PARAMS, 'temperature': temperature}
 
     async def transcribe(
         self,
@@ -111,54 +148,61 @@ class WhisperTranscriber:
         # Build optimal request
         request_params = self._build_whisper_request(audio_metadata)
 
-        # Retry logic with exponential backoff
-        for attempt in range(self.max_retries):
-            try:
-                # Read audio file
-                async with aiofiles.open(audio_file_path, 'rb') as audio_file:
-                    audio_data = await audio_file.read()
-
-                # Create in-memory file for API
-                audio_buffer = BytesIO(audio_data)
-                audio_buffer.name = audio_file_path
-
-                # Make API call
-                response = await self.client.audio.transcriptions.create(
-                    file=audio_buffer,
-                    **request_params
-                )
-
-                # Calculate confidence score
-                confidence = self._calculate_confidence(response)
-
-                # Check for quality issues
-                if self._has_quality_issues(response.text):
+        # The file is opened once and streamed by the HTTP client on each
+        # attempt (which rewinds it), rather than read into memory every time
+        with open(audio_file_path, 'rb') as audio_file:
+            # Retry logic with exponential backoff
+            for attempt in range(self.max_retries):
+                try:
+                    # Make API call
+                    response = await self.client.audio.transcriptions.create(
+                        file=(os.path.basename(audio_file_path), audio_file),
+                        **request_params
+                    )
+
+                    # Calculate confidence score
+                    confidence = self._calculate_confidence(response)
+
+                    # Check for quality issues
+                    # Long transcripts are checked in a worker thread to keep
+                    # the event loop responsive
+                    if len(response.text) > self.OFFLOAD_QUALITY_CHECK_CHARS:
+                        has_issues = await asyncio.to_thread(self._has_quality_issues, response.text)
+                    else:
+                        has_issues = self._has_quality_issues(response.text)
+
+                    if has_issues:
+                        if attempt < self.max_retries - 1:
+                            logger.warning("⚠️  Quality issue detected, retrying with adjusted params (attempt %d)", attempt + 2)
+                            # Adjust temperature and retry
+                            request_params['temperature'] = min(request_params['temperature'] + 0.2, 1.0)
+                            await self._async_sleep(self.base_retry_delay * (2 ** attempt))
+                            continue
+
+                    # Success
+                    return {
+                        'text': response.text,
+                        'language': getattr(response, 'language', 'unknown'),
+                        'duration': getattr(response, 'duration', audio_metadata.get('duration_seconds', 0)),
+                        'segments': getattr(response, 'segments', []),
+                        'confidence': confidence,
+                        'attempts': attempt + 1,
+                        'temperature_used': request_params['temperature']
+                    }
+
+                except Exception as e:
                     if attempt < self.max_retries - 1:
-                        print(f"⚠️  Quality issue detected, retrying with adjusted params (attempt {attempt + 2})")
-                        # Adjust temperature and retry
-                        request_params['temperature'] = min(request_params['temperature'] + 0.2, 1.0)
-                        await self._async_sleep(self.base_retry_delay * (2 ** attempt))
-                        continue
-
-                # Success
-                return {
-                    'text': response.text,
-                    'language': getattr(response, 'language', 'unknown'),
-                    'duration': getattr(response, 'duration', audio_metadata.get('duration_seconds', 0)),
-                    'segments': getattr(response, 'segments', []),
-                    'confidence': confidence,
-                    'attempts': attempt + 1,
-                    'temperature_used': request_params['temperature']
-                }
-
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    wait_time = self.base_retry_delay * (2 ** attempt)
-                    print(f"⚠️  Whisper API error (attempt {attempt + 1}/{self.max_retries}): {e}")
-                    print(f"   Retrying in {wait_time} seconds...")
-                    await self._async_sleep(wait_time)
-                else:
-                    raise Exception(f"Whisper API failed after {self.max_retries} attempts: {e}")
+                        wait_time = self.base_retry_delay * (2 ** attempt)
+                        logger.warning(
+                            "⚠️  Whisper API error (attempt %d/%d): %s. Retrying in %s seconds...",
+                            attempt + 1,
+                            self.max_retries,
+                            e,
+                            wait_time
+                        )
+                        await self._async_sleep(wait_time)
+                    else:
+                        raise Exception(f"Whisper API failed after {self.max_retries} attempts: {e}")
 
     async def _async_sleep(self, seconds: float):
         """Async sleep helper."""
@@ -225,28 +269,36 @@ class WhisperTranscriber:
         if len(words) < 10:
             return False  # Too short to have meaningful repetition
 
-        # Enhanced repetition check: Look for repeated 3-word phrases
-        for i in range(min(len(words) - 6, 50)):  # Check first 50 positions
-            phrase = " ".join(words[i:i+3])
-            # Count occurrences in the rest of the text
-            rest = " ".join(words[i+3:])
-            occurrences = rest.count(phrase)
+        # Enhanced repetition check: Look for repeated 3-word phrases.
+        # Record where each phrase starting in the first 50 positions occurs
+        # in one pass over the words, then count its later occurrences with a
+        # binary search, instead of re-joining and re-scanning the rest of the
+        # transcript for each of them.
+        checked = min(len(words) - 6, 50)  # Check first 50 positions
+        trigram_positions = {tuple(words[i:i + 3]): [] for i in range(checked)}
+        for position, trigram in enumerate(zip(words, words[1:], words[2:])):
+            found = trigram_positions.get(trigram)
+            if found is not None:
+                found.append(position)
+
+        for i in range(checked):
+            positions = trigram_positions[(words[i], words[i + 1], words[i + 2])]
+            occurrences = len(positions) - bisect_left(positions, i + 3)
 
             if occurrences >= 3:
-                print(f"⚠️  Repetition detected: '{phrase}' appears {occurrences + 1} times")
+                logger.warning("⚠️  Repetition detected: '%s' appears %d times", " ".join(words[i:i+3]), occurrences + 1)
                 return True  # Likely repetition bug
 
         # Check for very repetitive single words (more than 10% of text)
         if words:
-            word_freq = {}
-            for word in words:
-                word_lower = word.lower()
-                word_freq[word_lower] = word_freq.get(word_lower, 0) + 1
-
-            max_freq = max(word_freq.values())
+            most_common, max_freq = Counter(word.lower() for word in words).most_common(1)[0]
             if max_freq > len(words) * 0.1 and max_freq > 5:
-                most_common = max(word_freq, key=word_freq.get)
-                print(f"⚠️  Word repetition: '{most_common}' appears {max_freq} times ({max_freq/len(words)*100:.1f}%)")
+                logger.warning(
+                    "⚠️  Word repetition: '%s' appears %d times (%.1f%%)",
+                    most_common,
+                    max_freq,
+                    max_freq / len(words) * 100
+                )
                 return True
 
         return False
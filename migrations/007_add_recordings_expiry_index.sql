@@ -0,0 +1,12 @@
+-- Migration: Add partial covering index for audio cleanup
+-- Date: 2026-10-16
+-- Description: Index recordings that still have audio so the cleanup job can
+-- range-scan expired rows in keyset batches instead of scanning the table
+
+CREATE INDEX IF NOT EXISTS ix_recordings_expiry
+ON recordings (audio_delete_at, id)
+INCLUDE (file_path, file_size)
+WHERE can_regenerate = TRUE;
+
+-- Comments
+COMMENT ON INDEX ix_recordings_expiry IS 'Expired-audio lookup for cleanup_expired_audio (can_regenerate = true only)';
@@ -0,0 +1,11 @@
+-- Migration: Add expression index for the monthly usage reset
+-- Date: 2026-10-16
+-- Description: Index paid users by the day of month of their subscription
+-- anniversary so the daily reset is a single indexed UPDATE
+
+CREATE INDEX IF NOT EXISTS ix_users_reset_day
+ON users ((EXTRACT(DAY FROM subscription_anniversary_date)))
+WHERE is_trial_user = FALSE;
+
+-- Comments
+COMMENT ON INDEX ix_users_reset_day IS 'Anniversary-day lookup for reset_monthly_usage_for_day (paid users only)';
@@ -0,0 +1,13 @@
+-- Migration: Add audio content hash to transcriptions
+-- Date: 2026-10-16
+-- Description: Store the SHA-256 of each transcribed audio file so re-uploads
+-- of identical audio reuse the existing transcript instead of calling Whisper
+
+ALTER TABLE transcriptions
+ADD COLUMN IF NOT EXISTS audio_sha256 VARCHAR(64);
+
+CREATE INDEX IF NOT EXISTS ix_transcriptions_audio_sha256
+ON transcriptions (audio_sha256);
+
+-- Comments
+COMMENT ON COLUMN transcriptions.audio_sha256 IS 'SHA-256 of the source audio file, used to deduplicate transcription';
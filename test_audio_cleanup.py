@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.db.database import get_async_session
+from app.db.database import engine
 from app.models.user import User, SubscriptionTier
 from app.models.recording import Recording
 from app.services.audio_retention_service import AudioRetentionService
@@ -22,7 +22,17 @@ async def test_audio_cleanup():
 
     retention_service = AudioRetentionService()
 
-    async for db in get_async_session():
+    # Run everything in one outer transaction that is rolled back at the end.
+    # Session commits (including the cleanup job's own) only release SAVEPOINTs,
+    # so nothing is written to the WAL and no test data needs deleting after.
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        db = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+
         try:
             # Test 1: Create recording with expired audio
             print("📋 Test 1: Cleanup expired audio file")
@@ -49,7 +59,6 @@ async def test_audio_cleanup():
             )
             db.add(test_user)
             await db.commit()
-            await db.refresh(test_user)
 
             # Create recording with EXPIRED audio (delete_at is in the past)
             expired_recording = Recording(
@@ -65,7 +74,6 @@ async def test_audio_cleanup():
             )
             db.add(expired_recording)
             await db.commit()
-            await db.refresh(expired_recording)
 
             print(f"✅ Created expired recording: {expired_recording.id[:8]}...")
             print(f"   - Audio delete at: {expired_recording.audio_delete_at}")
@@ -120,7 +128,6 @@ async def test_audio_cleanup():
             )
             db.add(future_recording)
             await db.commit()
-            await db.refresh(future_recording)
 
             print(f"✅ Created non-expired recording: {future_recording.id[:8]}...")
             print(f"   - Audio delete at: {future_recording.audio_delete_at}")
@@ -163,7 +170,6 @@ async def test_audio_cleanup():
             )
             db.add(already_cleaned)
             await db.commit()
-            await db.refresh(already_cleaned)
 
             print(f"✅ Created already-cleaned recording: {already_cleaned.id[:8]}...")
             print(f"   - Can regenerate: {already_cleaned.can_regenerate} (already False)")
@@ -223,12 +229,7 @@ async def test_audio_cleanup():
                 os.remove(test_file_path2)
                 print(f"   - Deleted: {test_file_path2}")
 
-            # Delete test recordings and user
-            await db.delete(expired_recording)
-            await db.delete(future_recording)
-            await db.delete(already_cleaned)
-            await db.delete(test_user)
-            await db.commit()
+            # Test recordings and user are discarded with the outer transaction
             print(f"✅ Cleanup complete\n")
 
             print("=" * 50)
@@ -249,8 +250,8 @@ async def test_audio_cleanup():
             traceback.print_exc()
             raise
         finally:
-            # Break after first session
-            break
+            await db.close()
+            await transaction.rollback()
 
 
 if __name__ == "__main__":
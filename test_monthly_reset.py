@@ -3,15 +3,19 @@ Test script for monthly usage reset functionality.
 Verifies that the scheduler correctly resets usage for users on their anniversary date.
 """
 import asyncio
+import time
 from datetime import date, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete, text
 
-from app.db.database import get_async_session
+from app.db.database import AsyncSessionLocal
 from app.models.user import User, SubscriptionTier
 from app.services.usage_tracking_service import UsageTrackingService
 from app.services.scheduler import BackgroundScheduler
 
+# How long the pre-flight connectivity check may take before giving up
+DB_PREFLIGHT_TIMEOUT_SECONDS = 5.0
+
 
 async def test_monthly_reset():
     """Test the monthly usage reset logic."""
@@ -19,15 +23,27 @@ async def test_monthly_reset():
 
     usage_service = UsageTrackingService()
 
-    async for db in get_async_session():
+    # One session from the app's pooled session factory
+    async with AsyncSessionLocal() as db:
+        # Fail fast when the database is unreachable, instead of waiting out
+        # the TCP connect timeout on the first insert
+        try:
+            await asyncio.wait_for(db.execute(text("SELECT 1")), timeout=DB_PREFLIGHT_TIMEOUT_SECONDS)
+        except Exception as e:
+            print(f"❌ Database unavailable, cannot run tests: {e!r}")
+            raise SystemExit(1)
+
         try:
             # Test 1: Create a test user with usage on anniversary date
             print("📋 Test 1: User on subscription anniversary")
             print("-" * 50)
 
             today = date.today()
+            # One timestamp for every fixture email, so they can't drift apart
+            run_id = time.time_ns()
+            trial_email = f"trial_test_{run_id}@example.com"
             test_user = User(
-                email=f"test_reset_{datetime.now().timestamp()}@example.com",
+                email=f"test_reset_{run_id}@example.com",
                 hashed_password="test_hash",
                 is_trial_user=False,
                 subscription_tier=SubscriptionTier.BASIC,
@@ -37,9 +53,34 @@ async def test_monthly_reset():
                 usage_reset_at=datetime.utcnow()
             )
 
-            db.add(test_user)
+            # Users for Tests 2 and 3 are created up front so all fixtures go
+            # in with a single commit (ids are generated client-side and the
+            # session doesn't expire on commit, so no refreshes are needed)
+            tomorrow = (today + timedelta(days=1)).day
+            test_user2 = User(
+                email=f"test_no_reset_{run_id}@example.com",
+                hashed_password="test_hash",
+                is_trial_user=False,
+                subscription_tier=SubscriptionTier.PRO,
+                monthly_hours_limit=50.0,
+                monthly_hours_used=25.0,
+                subscription_anniversary_date=tomorrow,  # Anniversary is tomorrow, not today
+                usage_reset_at=datetime.utcnow() + timedelta(days=1)
+            )
+
+            trial_user = User(
+                email=trial_email,
+                is_trial_user=True,
+                trial_email=trial_email,
+                trial_minutes_used=5.0,
+                subscription_tier=SubscriptionTier.FREE,
+                monthly_hours_limit=0.0,
+                monthly_hours_used=0.0,
+                subscription_anniversary_date=today.day
+            )
+
+            db.add_all([test_user, test_user2, trial_user])
             await db.commit()
-            await db.refresh(test_user)
 
             print(f"✅ Created test user: {test_user.email}")
             print(f"   - Subscription tier: {test_user.subscription_tier.value}")
@@ -73,36 +114,22 @@ async def test_monthly_reset():
             print("📋 Test 2: User NOT on subscription anniversary")
             print("-" * 50)
 
-            tomorrow = (today + timedelta(days=1)).day
-            test_user2 = User(
-                email=f"test_no_reset_{datetime.now().timestamp()}@example.com",
-                hashed_password="test_hash",
-                is_trial_user=False,
-                subscription_tier=SubscriptionTier.PRO,
-                monthly_hours_limit=50.0,
-                monthly_hours_used=25.0,
-                subscription_anniversary_date=tomorrow,  # Anniversary is tomorrow, not today
-                usage_reset_at=datetime.utcnow() + timedelta(days=1)
-            )
-
-            db.add(test_user2)
-            await db.commit()
-            await db.refresh(test_user2)
-
             print(f"✅ Created test user: {test_user2.email}")
             print(f"   - Anniversary day: {test_user2.subscription_anniversary_date} (today is {today.day})")
             print(f"   - Monthly used: {test_user2.monthly_hours_used}h")
 
-            # This user should NOT be found by the reset job
+            # This user should NOT be found by the reset job. Only the fixture
+            # rows are checked (unique email index), not every user in the DB.
             result = await db.execute(
                 select(User).filter(
+                    User.email.in_([test_user.email, test_user2.email]),
                     User.subscription_anniversary_date == today.day,
                     User.is_trial_user == False
                 )
             )
             users_for_today = result.scalars().all()
 
-            user_emails = [u.email for u in users_for_today]
+            user_emails = {u.email for u in users_for_today}
             print(f"\n📊 Users with anniversary today: {len(users_for_today)}")
             print(f"   Should include: {test_user.email}")
             print(f"   Should NOT include: {test_user2.email}")
@@ -115,21 +142,6 @@ async def test_monthly_reset():
             print("📋 Test 3: Trial user should be skipped")
             print("-" * 50)
 
-            trial_user = User(
-                email=f"trial_test_{datetime.now().timestamp()}@example.com",
-                is_trial_user=True,
-                trial_email=f"trial_test_{datetime.now().timestamp()}@example.com",
-                trial_minutes_used=5.0,
-                subscription_tier=SubscriptionTier.FREE,
-                monthly_hours_limit=0.0,
-                monthly_hours_used=0.0,
-                subscription_anniversary_date=today.day
-            )
-
-            db.add(trial_user)
-            await db.commit()
-            await db.refresh(trial_user)
-
             print(f"✅ Created trial user: {trial_user.email}")
             print(f"   - Is trial: {trial_user.is_trial_user}")
             print(f"   - Trial minutes used: {trial_user.trial_minutes_used}")
@@ -157,9 +169,9 @@ async def test_monthly_reset():
 
             # Cleanup
             print("🧹 Cleaning up test users...")
-            await db.delete(test_user)
-            await db.delete(test_user2)
-            await db.delete(trial_user)
+            await db.execute(
+                delete(User).where(User.id.in_([test_user.id, test_user2.id, trial_user.id]))
+            )
             await db.commit()
             print(f"✅ Cleanup complete\n")
 
@@ -176,9 +188,6 @@ async def test_monthly_reset():
         except Exception as e:
             print(f"\n❌ Test failed with error: {e}")
             raise
-        finally:
-            # Break after first session
-            break
 
 
 if __name__ == "__main__":
@@ -186,6 +195,13 @@ if __name__ == "__main__":
     print("🚀 Monthly Usage Reset Test Suite")
     print("=" * 50 + "\n")
 
-    asyncio.run(test_monthly_reset())
+    # uvloop ships with uvicorn[standard] (not on Windows); use it when present
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
+    run(test_monthly_reset())
 
     print("\n✅ Test suite complete!\n")
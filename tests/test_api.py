@@ -2,38 +2,100 @@
 Basic API tests for Take My Dictation.
 """
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from app.db.database import get_db
 from app.main import app
 
+# Run in the session-scoped event loop that owns the shared client fixture
+pytestmark = pytest.mark.asyncio(scope="session")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """One ASGI client (and event loop) shared by every API test."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
-@pytest.mark.asyncio
-async def test_root_endpoint():
+
+async def test_root_endpoint(client):
     """Test the root endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["name"] == "Take My Dictation API"
-        assert data["status"] == "running"
+    response = await client.get("/")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Take My Dictation API"
+    assert data["status"] == "running"
 
 
-@pytest.mark.asyncio
-async def test_health_check():
+async def test_health_check(client):
     """Test the health check endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/admin/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
+    response = await client.get("/admin/health")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "healthy"
 
 
-@pytest.mark.asyncio
-async def test_stats_endpoint():
+async def test_stats_endpoint(client):
     """Test the stats endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/admin/stats")
-        assert response.status_code == 200
-        data = response.json()
-        assert "recordings" in data
-        assert "transcriptions" in data
-        assert "summaries" in data
+    response = await client.get("/admin/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert "recordings" in data
+    assert "transcriptions" in data
+    assert "summaries" in data
+
+
+class _FakeResult:
+    """Query result with no matching rows."""
+
+    def scalar_one_or_none(self):
+        return None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+class _FakeSession:
+    """Just enough of AsyncSession for the verification-code endpoints."""
+
+    def __init__(self):
+        self.added = []
+
+    async def execute(self, statement):
+        return _FakeResult()
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        pass
+
+    async def refresh(self, instance):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+async def test_resend_verification_code(client):
+    """Resending a code reuses the send path with the request's session."""
+    session = _FakeSession()
+
+    async def fake_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = fake_get_db
+    try:
+        response = await client.post(
+            "/auth/resend-verification", json={"email": "resend-test@example.com"}
+        )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert [v.email for v in session.added] == ["resend-test@example.com"]
@@ -0,0 +1,56 @@
+"""
+Tests for Whisper transcript repetition detection and quality scoring.
+"""
+import pytest
+
+from app.services.production_whisper_service import RepetitionDetector
+
+CLEAN_TRANSCRIPT = (
+    "Thanks everyone for joining today. We reviewed the launch checklist, "
+    "agreed that marketing owns the announcement email, and moved the "
+    "pricing page review to Thursday afternoon. Priya will send the final "
+    "copy to legal before the weekend."
+)
+
+REPETITIVE_TRANSCRIPT = (
+    "Okay so the next item on the agenda is the budget. "
+    + "Thank you for watching. " * 6
+)
+
+
+def test_detect_flags_whisper_repetition_loop():
+    """A phrase stuck in a loop is reported with the repeated text."""
+    has_rep, phrase = RepetitionDetector.detect(REPETITIVE_TRANSCRIPT)
+
+    assert has_rep is True
+    assert phrase and "Thank you for" in phrase
+
+
+def test_detect_passes_clean_transcript():
+    """Ordinary speech without loops is not flagged."""
+    assert RepetitionDetector.detect(CLEAN_TRANSCRIPT) == (False, None)
+
+
+def test_detect_ignores_short_text():
+    """Text too short to judge is never flagged."""
+    assert RepetitionDetector.detect("yes yes yes yes") == (False, None)
+
+
+def test_quality_score_detects_repetition_when_not_given():
+    """Without has_rep the score runs detection itself."""
+    assert RepetitionDetector.calculate_quality_score(CLEAN_TRANSCRIPT) == 1.0
+    assert RepetitionDetector.calculate_quality_score(REPETITIVE_TRANSCRIPT) < 0.5
+
+
+def test_quality_score_trusts_precomputed_repetition():
+    """A caller's has_rep result is used instead of re-running detection."""
+    assert RepetitionDetector.calculate_quality_score(CLEAN_TRANSCRIPT, has_rep=True) == 0.5
+    assert RepetitionDetector.calculate_quality_score(CLEAN_TRANSCRIPT, has_rep=False) == 1.0
+    assert RepetitionDetector.calculate_quality_score(
+        REPETITIVE_TRANSCRIPT, has_rep=False
+    ) == pytest.approx(RepetitionDetector.calculate_quality_score(REPETITIVE_TRANSCRIPT) + 0.5)
+
+
+def test_quality_score_empty_transcript():
+    """An empty transcript scores zero."""
+    assert RepetitionDetector.calculate_quality_score("") == 0.0
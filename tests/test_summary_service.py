@@ -0,0 +1,83 @@
+"""
+Tests for summary preprocessing and batching.
+"""
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.summary import SummaryFormat
+from app.services.summary_service import SummaryService, _prepare_transcription
+
+
+def test_prepare_transcription_strips_english_fillers():
+    """Filler sounds are removed from English transcripts."""
+    text = "So, um, we should uhh ship it, hmm, er, maybe Friday. mhm"
+    assert _prepare_transcription(text, "english") == "So, we should ship it, maybe Friday."
+
+
+def test_prepare_transcription_keeps_english_words_that_look_like_fillers():
+    """Only lowercase filler sounds are stripped, not words like ER or err."""
+    text = "Take him to the ER now. Err on the side of caution. UM students rock. We err often."
+    assert _prepare_transcription(text, "english") == text
+
+
+def test_prepare_transcription_keeps_non_english_words():
+    """'um' and 'er' are real words outside English and must survive."""
+    german = "Wir treffen uns um 5 Uhr, er kommt auch."
+    portuguese = "Eu comprei um carro e um livro."
+
+    assert _prepare_transcription(german, "german") == german
+    assert _prepare_transcription(portuguese, "pt") == portuguese
+    # Unknown language is treated as non-English
+    assert _prepare_transcription(portuguese) == portuguese
+
+
+class _FakeMessages:
+    """Stands in for client.messages, answering a batch via a reply builder."""
+
+    def __init__(self, build_reply):
+        self.build_reply = build_reply
+
+    async def create(self, **kwargs):
+        ids = re.findall(r"=== TRANSCRIPTION (\S+) ===", kwargs["messages"][0]["content"])
+        text = json.dumps(self.build_reply(ids))
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def _service(build_reply):
+    service = SummaryService.__new__(SummaryService)
+    service.client = SimpleNamespace(messages=_FakeMessages(build_reply))
+    service.model = "test-model"
+
+    async def single(transcription_text, format):
+        return {"summary": f"single:{transcription_text}"}
+
+    service._generate_json_single = single
+    return service
+
+
+@pytest.mark.asyncio
+async def test_batch_results_are_matched_by_id_not_position():
+    """A reordered batch reply still maps each summary to its own transcript."""
+    def reply(ids):
+        return [{"id": i, "summary": f"batch:{i}"} for i in reversed(ids)]
+
+    results = await _service(reply)._generate_json_batch(["a", "b", "c"], SummaryFormat.QUICK_SUMMARY)
+
+    assert [r["summary"].split("-")[0] for r in results] == ["batch:1", "batch:2", "batch:3"]
+    assert all("id" not in r for r in results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("build_reply", [
+    lambda ids: [{"id": i, "summary": "x"} for i in ids[:-1]],  # short
+    lambda ids: [{"id": ids[0], "summary": "x"} for _ in ids],  # duplicated id
+    lambda ids: [{"summary": "x"} for _ in ids],  # ids missing
+])
+async def test_mismatched_batch_reply_falls_back_to_single_calls(build_reply):
+    """Any id mismatch discards the batch reply and summarizes individually."""
+    results = await _service(build_reply)._generate_json_batch(["a", "b"], SummaryFormat.QUICK_SUMMARY)
+
+    assert results == [{"summary": "single:a"}, {"summary": "single:b"}]
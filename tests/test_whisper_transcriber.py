@@ -0,0 +1,54 @@
+"""
+Tests for WhisperTranscriber transcript quality checks.
+"""
+import pytest
+
+from app.services.whisper_transcriber import WhisperTranscriber
+
+PHRASE = "alpha beta gamma"
+
+
+def _quadratic_trigram_repeats(text: str) -> bool:
+    """The original trigram scan: re-join and count the rest for each position."""
+    words = text.split()
+    for i in range(min(len(words) - 6, 50)):
+        phrase = " ".join(words[i:i+3])
+        rest = " ".join(words[i+3:])
+        if rest.count(phrase) >= 3:
+            return True
+    return False
+
+
+def _transcript(phrase_count: int, filler_between: int = 8) -> str:
+    """Unique filler words with PHRASE repeated phrase_count times."""
+    parts = []
+    filler = (f"word{n}" for n in range(10_000))
+    for _ in range(phrase_count):
+        parts.extend(next(filler) for _ in range(filler_between))
+        parts.append(PHRASE)
+    parts.extend(next(filler) for _ in range(filler_between))
+    return " ".join(parts)
+
+
+@pytest.mark.parametrize("phrase_count, expected", [
+    (2, False),
+    (3, False),  # two later occurrences: just under the threshold
+    (4, True),   # three later occurrences: at the threshold
+    (5, True),
+])
+def test_trigram_check_matches_original_at_threshold(phrase_count, expected):
+    """The linear trigram check flags exactly what the quadratic scan did."""
+    transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+    text = _transcript(phrase_count)
+
+    assert _quadratic_trigram_repeats(text) is expected
+    assert transcriber._has_quality_issues(text) is expected
+
+
+def test_trigram_check_only_counts_phrases_starting_in_first_positions():
+    """Like the original, a phrase first seen after position 50 is not checked."""
+    transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+    text = _transcript(4, filler_between=60)
+
+    assert _quadratic_trigram_repeats(text) is False
+    assert transcriber._has_quality_issues(text) is False